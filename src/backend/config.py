@@ -38,6 +38,19 @@ class Settings(BaseSettings):
     generated_path: Path = Path("data/generated")
     models_path: Path = Path("models")
 
+    # ML inference settings
+    # Apply dynamic int8 quantization to MMS_FA when it runs on CPU.
+    # Off by default: it trades some alignment accuracy for speed.
+    mms_fa_quantize_cpu: bool = False
+    # Compile the MMS_FA encoder with torch.compile when it runs on CUDA.
+    # Off by default: compilation adds minutes to model loading.
+    mms_fa_compile: bool = False
+    # Enable TF32 matmuls and expandable CUDA allocator segments for every
+    # model in the process. Applied once when src.backend.ml.gpu_fallback is
+    # imported, which every ML module does before touching the GPU. Off by
+    # default: TF32 changes FP32 numerics of the SOFA and Wav2Vec2 models.
+    cuda_tuning: bool = False
+
     # Job settings
     job_ttl_seconds: int = 7 * 24 * 3600  # 7 days
 
@@ -18,21 +18,30 @@ vowel segments (not just the final one), which is critical for VCV samples
 with repeated vowels like [a, k, a] where each vowel may be sustained.
 """
 
+import asyncio
 import logging
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 
-import librosa
 import numpy as np
+import soundfile as sf
 import torch
 import torchaudio
 import torchaudio.functional as F
+from torch.nn.utils.rnn import pad_sequence
 
+from src.backend.config import get_settings
 from src.backend.domain.alignment_config import AlignmentParams
 from src.backend.domain.phoneme import PhonemeDetectionResult, PhonemeSegment
-from src.backend.ml.gpu_fallback import run_inference_with_cpu_fallback
+from src.backend.ml.gpu_fallback import (
+    quantize_model_for_cpu,
+    run_inference_with_cpu_fallback,
+)
+from src.backend.ml.model_registry import get_model_config
 from src.backend.utils.kana_romaji import contains_kana, kana_to_romaji
 
 logger = logging.getLogger(__name__)
@@ -42,6 +51,7 @@ MMS_FA_SAMPLE_RATE = 16000
 
 # Energy analysis parameters for extending segments
 ENERGY_HOP_LENGTH = 256  # ~16ms at 16kHz
+ENERGY_FRAME_LENGTH = 2048  # RMS window, centered on each hop (librosa default)
 
 # Threshold ratios for energy-based boundary detection
 # Attack threshold is lower to capture quiet consonants (m, n, h, f, s, etc.)
@@ -75,8 +85,34 @@ MAX_FA_ENERGY_OFFSET_MS = 300.0
 # If FA detects a segment much later than previous segment ends, adjust it
 MAX_SEGMENT_GAP_MS = 200.0
 
-# Cache directory for models
-MODELS_DIR = Path(__file__).parent.parent.parent.parent / "models" / "torchaudio"
+# Number of files per batched MMS_FA forward pass in batch_detect_phonemes
+ALIGNMENT_BATCH_SIZE = 8
+
+# Forward-pass batches loaded, bucketed and aligned together by
+# batch_detect_phonemes. Bounds peak memory to a few batches of preprocessed
+# audio however many files a voicebank has.
+ALIGNMENT_BATCHES_PER_CHUNK = 4
+
+# Model name reported for single-phoneme transcripts, which are placed from
+# energy boundaries alone without running MMS_FA
+ENERGY_ONLY_MODEL_NAME = "energy-only"
+
+# Upper bound on the confidence of an energy-only segment. OtoSuggester counts
+# raw segment confidence of 0.3 and above as fully confident, so the cap sits
+# at half of that: without alignment evidence, a sample placed from energy
+# alone should not score like an aligned one.
+ENERGY_ONLY_MAX_CONFIDENCE = 0.15
+
+# Maximum longest/shortest waveform length ratio within one batched forward
+# pass. Files are sorted by length first; a batch is cut early rather than pad
+# a short file to more than this multiple of its length.
+ALIGNMENT_BUCKET_MAX_LENGTH_RATIO = 3.0
+
+# Preprocessed audio files kept per detector, so re-aligning the same samples
+# (e.g. while tuning energy thresholds) skips decoding and resampling. Each
+# entry holds the normalized waveform and the raw audio, both float32 at
+# 16 kHz: about 128 KB per second of audio.
+PREPROCESSED_AUDIO_CACHE_SIZE = 256
 
 
 class ForcedAlignmentError(Exception):
@@ -91,7 +127,7 @@ class TranscriptExtractionError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class TranscriptResult:
     """Result of extracting transcript from UTAU filename.
 
@@ -137,6 +173,24 @@ UTAU_BREATH_MARKERS = frozenset(["息", "吸", "br", "breath"])
 # Rest/silence markers
 UTAU_REST_MARKERS = frozenset(["R", "・", "rest", "sil", "-"])
 
+# Numeric prefix on sample names (like "01_ka" -> "ka")
+_NUMERIC_PREFIX_RE = re.compile(r"^\d+[_-]?")
+
+# Breath marks and punctuation deleted from names before phoneme conversion
+_SPECIAL_CHARS_TABLE = str.maketrans("", "", "-。、")
+
+
+@lru_cache(maxsize=1)
+def get_models_dir() -> Path:
+    """Get the cache directory for MMS_FA model artifacts (from registry).
+
+    Resolved on first use rather than at import time.
+
+    Returns:
+        Path to the torchaudio model cache directory
+    """
+    return get_model_config("mms-fa").cache_dir
+
 
 @lru_cache(maxsize=1)
 def get_mms_fa_model() -> tuple[torch.nn.Module, dict[str, int]]:
@@ -144,6 +198,12 @@ def get_mms_fa_model() -> tuple[torch.nn.Module, dict[str, int]]:
 
     Uses LRU cache to ensure model is only loaded once per session.
 
+    The model is always placed on cuda:0 when CUDA is available, never on the
+    current device: F.forced_align hits illegal memory accesses on other CUDA
+    device indices. On CPU, Linear layers are dynamically quantized to int8
+    if Settings.mms_fa_quantize_cpu is enabled. On CUDA, the encoder is
+    compiled with torch.compile if Settings.mms_fa_compile is enabled.
+
     Returns:
         Tuple of (model, dictionary) where dictionary maps characters to token IDs
 
@@ -155,12 +215,42 @@ def get_mms_fa_model() -> tuple[torch.nn.Module, dict[str, int]]:
     try:
         bundle = torchaudio.pipelines.MMS_FA
 
-        # Get device
-        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        # Get device (pinned to cuda:0, see docstring)
+        device = (
+            torch.device("cuda:0") if torch.cuda.is_available() else torch.device("cpu")
+        )
+
+        # Download weights into the registry cache directory, which is persisted
+        # across container restarts (the default torch hub cache is not)
+        models_dir = get_models_dir()
+        models_dir.mkdir(parents=True, exist_ok=True)
 
         # Load model without star token (we don't need it for simple alignment)
-        model = bundle.get_model(with_star=False).to(device)
+        model = bundle.get_model(
+            with_star=False, dl_kwargs={"model_dir": str(models_dir)}
+        ).to(device)
         model.eval()
+        settings = get_settings()
+        if device.type == "cuda":
+            # Store weights in FP16 to halve their memory traffic; inference
+            # runs under autocast, which keeps precision-sensitive ops such as
+            # layer norm in FP32. The CPU fallback restores FP32 weights.
+            model.half()
+            if settings.mms_fa_compile:
+                # Compile the inner encoder in place so both the bundle wrapper
+                # and the batched path (which calls model.model) use it.
+                # Waveform lengths vary per file, so compile for dynamic shapes
+                # rather than capturing CUDA graphs, and warm up once here so
+                # the first real file does not pay for compilation.
+                model.model = torch.compile(model.model, dynamic=True)
+                with torch.inference_mode(), _inference_autocast(device):
+                    model(torch.zeros(1, MMS_FA_SAMPLE_RATE, device=device))
+        elif settings.mms_fa_quantize_cpu:
+            # Dynamic int8 quantization of the encoder's Linear layers, which
+            # dominate the forward pass, roughly halves CPU inference time.
+            # Activations stay FP32. Enable with UVM_MMS_FA_QUANTIZE_CPU=true.
+            model = quantize_model_for_cpu(model)
+            logger.info("Applied dynamic int8 quantization to MMS_FA for CPU")
 
         # Get dictionary mapping characters to token IDs
         # star=None means no star token in dictionary
@@ -210,6 +300,7 @@ def extract_transcript_from_filename(filename: str) -> str:
     return result.transcript
 
 
+@lru_cache(maxsize=4096)
 def extract_transcript_with_metadata(filename: str) -> TranscriptResult:
     """Extract transcript and metadata from UTAU filename.
 
@@ -226,6 +317,9 @@ def extract_transcript_with_metadata(filename: str) -> TranscriptResult:
     - あ゛.wav -> transcript="a", is_growl_variant=True
     - 息.wav -> transcript="", is_breath_sample=True
 
+    Results are cached per filename, so repeated lookups across batch runs
+    skip the regex and kana conversion work.
+
     Args:
         filename: The audio filename (with or without path)
 
@@ -252,7 +346,7 @@ def extract_transcript_with_metadata(filename: str) -> TranscriptResult:
     name = name.lstrip("_")
 
     # Remove any numeric prefix (like "01_ka" -> "ka")
-    name = re.sub(r"^\d+[_-]?", "", name)
+    name = _NUMERIC_PREFIX_RE.sub("", name)
 
     # Check for breath sample markers (before other processing)
     name_lower = name.lower()
@@ -280,18 +374,18 @@ def extract_transcript_with_metadata(filename: str) -> TranscriptResult:
     if name.endswith(UTAU_GROWL_MARKER):
         is_growl_variant = True
         name = name[: -len(UTAU_GROWL_MARKER)]
-        logger.debug(f"Stripped ゛ growl marker from {original_filename}")
+        logger.debug("Stripped ゛ growl marker from %s", original_filename)
 
     # Check for 子音 (consonant-only) suffix AFTER growl marker
     if name.endswith(UTAU_CONSONANT_ONLY_MARKER):
         is_consonant_only = True
         name = name[: -len(UTAU_CONSONANT_ONLY_MARKER)]
-        logger.debug(f"Stripped 子音 suffix from {original_filename}")
+        logger.debug("Stripped 子音 suffix from %s", original_filename)
 
     # Handle special UTAU notation
     # - Remove breath marks and special characters (but not dakuten ゛ which was handled above)
     # Note: We keep ・ for now as it might be part of VCV patterns
-    name = re.sub(r"[-。、]", "", name)
+    name = name.translate(_SPECIAL_CHARS_TABLE)
 
     # After stripping markers, check if anything meaningful remains
     if not name.strip():
@@ -330,10 +424,83 @@ def extract_transcript_with_metadata(filename: str) -> TranscriptResult:
     )
 
 
+def _rms_from_squares(
+    squares: np.ndarray,
+    hop_length: int = ENERGY_HOP_LENGTH,
+    frame_length: int = ENERGY_FRAME_LENGTH,
+) -> np.ndarray:
+    """Compute per-frame RMS energy from squared audio samples.
+
+    Frames are centered on each hop with zero padding, matching
+    librosa.feature.rms defaults. Window sums come from a running sum, so
+    the cost is linear in the number of samples regardless of frame length.
+
+    Args:
+        squares: Squared audio samples
+        hop_length: Hop length between frames
+        frame_length: Window length of each frame
+
+    Returns:
+        float32 array of RMS energy per frame
+    """
+    padded = np.pad(squares, frame_length // 2)
+    csum = np.concatenate(([0.0], np.cumsum(padded, dtype=np.float64)))
+    n_frames = 1 + (len(padded) - frame_length) // hop_length
+    frame_starts = np.arange(n_frames) * hop_length
+    window_sums = csum[frame_starts + frame_length] - csum[frame_starts]
+    # Clamp tiny negative values from floating-point cancellation
+    power = np.maximum(window_sums / frame_length, 0.0)
+    return np.sqrt(power).astype(np.float32)
+
+
+def _frame_times_ms(n_frames: int, sample_rate: int, hop_length: int) -> np.ndarray:
+    """Timestamp in milliseconds of each RMS frame, as float32.
+
+    Kept in the same precision as the RMS values so comparisons and scans
+    over energy frames never upcast to float64.
+    """
+    ms_per_frame = np.float32(hop_length * 1000.0 / sample_rate)
+    return np.arange(n_frames, dtype=np.float32) * ms_per_frame
+
+
+def _noise_and_signal_rms(rms: np.ndarray) -> tuple[np.float32, np.float32]:
+    """Estimate noise floor and signal level as the 10th/90th RMS percentiles.
+
+    Returned as float32 so thresholds derived from them compare against the
+    float32 RMS frames without upcasting.
+    """
+    noise_rms, signal_rms = np.percentile(rms, [10, 90]).astype(np.float32)
+    return noise_rms, signal_rms
+
+
+def _preprocess_and_energy(
+    audio: np.ndarray,
+    hop_length: int = ENERGY_HOP_LENGTH,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Peak-normalize audio and compute its RMS energy in one pass.
+
+    Squares the samples once and derives both the normalization peak
+    (sqrt of the largest square) and the per-frame RMS from that buffer,
+    instead of scanning the audio separately for each.
+
+    Args:
+        audio: Raw audio samples
+        hop_length: Hop length for RMS calculation
+
+    Returns:
+        Tuple of (normalized_audio, rms) where rms is computed from the
+        unnormalized audio
+    """
+    squares = np.square(audio)
+    max_val = np.sqrt(squares.max())
+    normalized = audio / max_val if max_val > 0 else audio
+    return normalized, _rms_from_squares(squares, hop_length)
+
+
 def preprocess_audio_for_alignment(
     file_path: Path,
     target_sr: int = MMS_FA_SAMPLE_RATE,
-) -> tuple[torch.Tensor, int, float, np.ndarray]:
+) -> tuple[torch.Tensor, int, float, np.ndarray, np.ndarray]:
     """Load and preprocess audio for MMS_FA forced alignment.
 
     Args:
@@ -341,31 +508,39 @@ def preprocess_audio_for_alignment(
         target_sr: Target sample rate (16kHz for MMS_FA)
 
     Returns:
-        Tuple of (waveform_tensor, sample_rate, duration_ms, raw_audio)
+        Tuple of (waveform_tensor, sample_rate, duration_ms, raw_audio, rms)
         where raw_audio is the unnormalized numpy array for energy analysis
+        and rms is its per-frame RMS energy at ENERGY_HOP_LENGTH
 
     Raises:
         ForcedAlignmentError: If audio cannot be processed
     """
     try:
-        # Load audio with librosa for robust format handling
-        audio, sr = librosa.load(str(file_path), sr=target_sr, mono=True)
+        # Decode with libsndfile, downmix to mono, and resample with
+        # torchaudio's polyphase resampler (faster than soxr resampling via librosa)
+        audio, sr = sf.read(str(file_path), dtype="float32", always_2d=True)
+        audio = audio.mean(axis=1)
+        if sr != target_sr:
+            audio = F.resample(torch.from_numpy(audio), sr, target_sr).numpy()
+            sr = target_sr
 
         # Calculate duration in milliseconds
         duration_ms = (len(audio) / sr) * 1000
 
-        # Keep raw audio for energy analysis
-        raw_audio = audio.copy()
+        # Keep raw audio for energy analysis. No copy is needed: the
+        # normalization below is out-of-place and leaves this buffer intact.
+        raw_audio = audio
 
-        # Normalize audio for model
-        max_val = np.max(np.abs(audio))
-        if max_val > 0:
-            audio = audio / max_val
+        # Normalize audio for model, computing RMS energy in the same pass
+        normalized, rms = _preprocess_and_energy(audio)
 
-        # Convert to torch tensor with batch dimension [1, num_samples]
-        waveform = torch.from_numpy(audio).float().unsqueeze(0)
+        # Convert to torch tensor with batch dimension [1, num_samples]. It
+        # stays in pageable memory: pinning every file costs a cudaHostAlloc
+        # that outweighs the faster copy, and cached waveforms would hold on
+        # to scarce page-locked memory.
+        waveform = torch.from_numpy(normalized).float().unsqueeze(0)
 
-        return waveform, sr, duration_ms, raw_audio
+        return waveform, sr, duration_ms, raw_audio, rms
 
     except Exception as e:
         logger.exception(f"Failed to process audio file: {file_path}")
@@ -381,6 +556,7 @@ def detect_energy_boundaries(
     release_threshold_ratio: float | None = None,
     alignment_params: AlignmentParams | None = None,
     min_silence_duration_ms: float = MIN_SILENCE_DURATION_MS,
+    rms: np.ndarray | None = None,
 ) -> tuple[float, float]:
     """Detect sound boundaries using RMS energy analysis with continuity detection.
 
@@ -414,6 +590,9 @@ def detect_energy_boundaries(
                                 treat as an actual boundary. Brief dips shorter
                                 than this are merged as continuous sound.
                                 Defaults to MIN_SILENCE_DURATION_MS (80ms).
+        rms: Optional precomputed per-frame RMS energy of audio at hop_length
+             (e.g. from preprocess_audio_for_alignment). Computed from audio
+             if not provided.
 
     Returns:
         Tuple of (start_ms, end_ms) representing sound boundaries
@@ -421,6 +600,53 @@ def detect_energy_boundaries(
     # threshold_ratio is a legacy parameter kept for backwards compatibility
     _ = threshold_ratio
 
+    attack_threshold_ratio, release_threshold_ratio = _resolve_energy_threshold_ratios(
+        alignment_params, attack_threshold_ratio, release_threshold_ratio
+    )
+
+    # Calculate RMS energy
+    if rms is None:
+        rms = _rms_from_squares(np.square(audio), hop_length)
+
+    duration_ms = len(audio) / sample_rate * 1000
+    if len(rms) == 0:
+        return 0.0, duration_ms
+
+    # Frame timestamps in milliseconds (frame index * hop duration)
+    times = _frame_times_ms(len(rms), sample_rate, hop_length)
+
+    # Determine threshold using noise floor estimation
+    # Bottom 10% is likely silence, top 90% is likely signal (one sort for both)
+    noise_rms, signal_rms = _noise_and_signal_rms(rms)
+
+    return _energy_boundaries_from_rms(
+        rms,
+        times,
+        noise_rms,
+        signal_rms,
+        attack_threshold_ratio,
+        release_threshold_ratio,
+        min_silence_duration_ms,
+        duration_ms,
+    )
+
+
+def _resolve_energy_threshold_ratios(
+    alignment_params: AlignmentParams | None,
+    attack_threshold_ratio: float | None,
+    release_threshold_ratio: float | None,
+) -> tuple[float, float]:
+    """Resolve attack/release threshold ratios from params, args, or defaults.
+
+    Args:
+        alignment_params: Optional AlignmentParams whose energy_threshold_ratio
+                         fills in any ratio not given explicitly
+        attack_threshold_ratio: Explicit attack ratio, or None
+        release_threshold_ratio: Explicit release ratio, or None
+
+    Returns:
+        Tuple of (attack_threshold_ratio, release_threshold_ratio)
+    """
     # Use alignment_params if provided, otherwise fall back to explicit args or defaults
     if alignment_params is not None:
         # Use energy_threshold_ratio from params for both attack and release
@@ -442,22 +668,38 @@ def detect_energy_boundaries(
         if release_threshold_ratio is None:
             release_threshold_ratio = ENERGY_RELEASE_THRESHOLD_RATIO
 
-    # Calculate RMS energy
-    rms = librosa.feature.rms(y=audio, hop_length=hop_length)[0]
-    times = (
-        librosa.frames_to_time(
-            np.arange(len(rms)), sr=sample_rate, hop_length=hop_length
-        )
-        * 1000
-    )
+    return attack_threshold_ratio, release_threshold_ratio
 
-    if len(rms) == 0:
-        return 0.0, len(audio) / sample_rate * 1000
 
-    # Determine threshold using noise floor estimation
-    noise_rms = np.percentile(rms, 10)  # Bottom 10% is likely silence
-    signal_rms = np.percentile(rms, 90)  # Top 90% is likely signal
+def _energy_boundaries_from_rms(
+    rms: np.ndarray,
+    times: np.ndarray,
+    noise_rms: float,
+    signal_rms: float,
+    attack_threshold_ratio: float,
+    release_threshold_ratio: float,
+    min_silence_duration_ms: float,
+    duration_ms: float,
+) -> tuple[float, float]:
+    """Detect sound boundaries from non-empty RMS frames and noise statistics.
 
+    Shared by detect_energy_boundaries and compute_energy_profile_and_boundaries
+    so the RMS and percentile work can be done once by the caller.
+
+    Args:
+        rms: Non-empty RMS energy array
+        times: Time array in milliseconds corresponding to RMS frames
+        noise_rms: Noise floor estimate (10th percentile of rms)
+        signal_rms: Signal level estimate (90th percentile of rms)
+        attack_threshold_ratio: Ratio above noise floor for onset detection
+        release_threshold_ratio: Ratio above noise floor for offset detection
+        min_silence_duration_ms: Minimum silence treated as an actual boundary
+        duration_ms: Total audio duration, returned as the end when no sound
+                     is found
+
+    Returns:
+        Tuple of (start_ms, end_ms) representing sound boundaries
+    """
     # Calculate separate thresholds for attack (onset) and release (offset)
     # Attack threshold is lower to capture quiet consonants
     attack_threshold = noise_rms + (signal_rms - noise_rms) * attack_threshold_ratio
@@ -476,14 +718,14 @@ def detect_energy_boundaries(
 
     if not sound_regions:
         # No sound detected, return full duration
-        return 0.0, len(audio) / sample_rate * 1000
+        return 0.0, duration_ms
 
     # Merge adjacent regions if the gap is shorter than min_silence_duration_ms
     # This prevents splitting notes at brief energy dips during sustain
     merged_regions = _merge_adjacent_regions(sound_regions, min_silence_duration_ms)
 
     if not merged_regions:
-        return 0.0, len(audio) / sample_rate * 1000
+        return 0.0, duration_ms
 
     # Use the first and last merged region for overall boundaries
     # For single continuous sounds, this will be one region spanning the whole note
@@ -492,24 +734,24 @@ def detect_energy_boundaries(
 
     # Now refine boundaries using attack/release thresholds for precision
     # Find onset: first frame above attack threshold within the overall region
-    above_attack = rms > attack_threshold
+    attack_frames = np.flatnonzero(rms > attack_threshold)
 
-    if not any(above_attack):
+    if attack_frames.size == 0:
         # No sound detected with attack threshold, use hysteresis boundaries
         start_ms = max(0.0, overall_start_ms - ENERGY_ONSET_PADDING_MS)
         end_ms = overall_end_ms + ENERGY_END_PADDING_MS
         return start_ms, end_ms
 
     # Find first frame above attack threshold (sensitive to quiet consonants)
-    first_frame = int(np.argmax(above_attack))
+    first_frame = int(attack_frames[0])
 
     # Find offset: last frame above release threshold
-    above_release = rms > release_threshold
-    if any(above_release):
-        last_frame = len(rms) - 1 - int(np.argmax(above_release[::-1]))
+    release_frames = np.flatnonzero(rms > release_threshold)
+    if release_frames.size:
+        last_frame = int(release_frames[-1])
     else:
         # Fall back to attack threshold if release threshold finds nothing
-        last_frame = len(rms) - 1 - int(np.argmax(above_attack[::-1]))
+        last_frame = int(attack_frames[-1])
 
     # Apply padding to ensure we don't clip the consonant
     # Subtract padding from start time (move earlier)
@@ -546,7 +788,9 @@ def _find_sound_regions_with_hysteresis(
     is_on = False
     region_start_ms = 0.0
 
-    for energy, time_ms in zip(rms, times, strict=True):
+    # Plain floats compare and unpack faster than NumPy scalars
+    times_ms = times.tolist()
+    for energy, time_ms in zip(rms.tolist(), times_ms, strict=True):
         if not is_on:
             # Currently off, check if we should turn on
             if energy > on_threshold:
@@ -559,8 +803,8 @@ def _find_sound_regions_with_hysteresis(
                 regions.append((region_start_ms, time_ms))
 
     # If still on at end, close the final region
-    if is_on and len(times) > 0:
-        regions.append((region_start_ms, float(times[-1])))
+    if is_on and times_ms:
+        regions.append((region_start_ms, times_ms[-1]))
 
     return regions
 
@@ -595,7 +839,7 @@ def _merge_adjacent_regions(
             # Extend current region to include the next one
             current_end = next_end
             logger.debug(
-                f"Merging regions: gap of {gap:.1f}ms < {min_gap_ms:.1f}ms threshold"
+                "Merging regions: gap of %.1fms < %.1fms threshold", gap, min_gap_ms
             )
         else:
             # Gap is long enough, save current region and start new one
@@ -614,6 +858,11 @@ def _merge_adjacent_regions(
 # in UTAU samples, so they benefit from energy-based boundary extension.
 VOWEL_CHARACTERS = frozenset("aeiou")
 
+# VOWEL_CHARACTERS in both cases, so per-phoneme checks need no str.lower().
+# Only ASCII A/E/I/O/U lower-case into a vowel, so this matches
+# `phoneme.lower() in VOWEL_CHARACTERS` exactly.
+_VOWEL_LOOKUP = VOWEL_CHARACTERS | frozenset(c.upper() for c in VOWEL_CHARACTERS)
+
 
 @dataclass
 class EnergyProfile:
@@ -634,6 +883,7 @@ def compute_energy_profile(
     sample_rate: int,
     hop_length: int = ENERGY_HOP_LENGTH,
     alignment_params: AlignmentParams | None = None,
+    rms: np.ndarray | None = None,
 ) -> EnergyProfile:
     """Compute a frame-level energy profile for per-segment boundary analysis.
 
@@ -646,17 +896,15 @@ def compute_energy_profile(
         sample_rate: Audio sample rate
         hop_length: Hop length for RMS calculation
         alignment_params: Optional alignment parameters for threshold tuning
+        rms: Optional precomputed per-frame RMS energy of audio at hop_length.
+             Computed from audio if not provided.
 
     Returns:
         EnergyProfile with per-frame RMS, timestamps, and release threshold
     """
-    rms = librosa.feature.rms(y=audio, hop_length=hop_length)[0]
-    times_ms = (
-        librosa.frames_to_time(
-            np.arange(len(rms)), sr=sample_rate, hop_length=hop_length
-        )
-        * 1000
-    )
+    if rms is None:
+        rms = _rms_from_squares(np.square(audio), hop_length)
+    times_ms = _frame_times_ms(len(rms), sample_rate, hop_length)
 
     if len(rms) == 0:
         return EnergyProfile(
@@ -666,8 +914,7 @@ def compute_energy_profile(
         )
 
     # Determine threshold using noise floor estimation (same logic as detect_energy_boundaries)
-    noise_rms = np.percentile(rms, 10)
-    signal_rms = np.percentile(rms, 90)
+    noise_rms, signal_rms = _noise_and_signal_rms(rms)
 
     if alignment_params is not None:
         release_ratio = alignment_params.energy_threshold_ratio
@@ -683,6 +930,67 @@ def compute_energy_profile(
     )
 
 
+def compute_energy_profile_and_boundaries(
+    audio: np.ndarray,
+    sample_rate: int,
+    hop_length: int = ENERGY_HOP_LENGTH,
+    alignment_params: AlignmentParams | None = None,
+    min_silence_duration_ms: float = MIN_SILENCE_DURATION_MS,
+    rms: np.ndarray | None = None,
+) -> tuple[EnergyProfile, float, float]:
+    """Compute the energy profile and global sound boundaries together.
+
+    Equivalent to calling compute_energy_profile and detect_energy_boundaries
+    with the same arguments, but the RMS frames, timestamps, and noise/signal
+    percentiles are computed once and shared.
+
+    Args:
+        audio: Raw audio samples (numpy array, not normalized)
+        sample_rate: Audio sample rate
+        hop_length: Hop length for RMS calculation
+        alignment_params: Optional alignment parameters for threshold tuning
+        min_silence_duration_ms: Minimum duration of silence (in ms) required to
+                                treat as an actual boundary
+        rms: Optional precomputed per-frame RMS energy of audio at hop_length.
+             Computed from audio if not provided.
+
+    Returns:
+        Tuple of (energy_profile, start_ms, end_ms)
+    """
+    attack_threshold_ratio, release_threshold_ratio = _resolve_energy_threshold_ratios(
+        alignment_params, None, None
+    )
+
+    if rms is None:
+        rms = _rms_from_squares(np.square(audio), hop_length)
+    times_ms = _frame_times_ms(len(rms), sample_rate, hop_length)
+
+    duration_ms = len(audio) / sample_rate * 1000
+    if len(rms) == 0:
+        profile = EnergyProfile(rms=rms, times_ms=times_ms, release_threshold=0.0)
+        return profile, 0.0, duration_ms
+
+    noise_rms, signal_rms = _noise_and_signal_rms(rms)
+
+    release_threshold = noise_rms + (signal_rms - noise_rms) * release_threshold_ratio
+    profile = EnergyProfile(
+        rms=rms,
+        times_ms=times_ms,
+        release_threshold=release_threshold,
+    )
+    start_ms, end_ms = _energy_boundaries_from_rms(
+        rms,
+        times_ms,
+        noise_rms,
+        signal_rms,
+        attack_threshold_ratio,
+        release_threshold_ratio,
+        min_silence_duration_ms,
+        duration_ms,
+    )
+    return profile, start_ms, end_ms
+
+
 def find_energy_end_in_region(
     energy_profile: EnergyProfile,
     region_start_ms: float,
@@ -713,24 +1021,23 @@ def find_energy_end_in_region(
     if len(rms) == 0:
         return None
 
-    # Find frames within the region
-    region_mask = (times >= region_start_ms) & (times <= region_end_ms)
-    region_indices = np.where(region_mask)[0]
+    # Find frames within the region (times are monotonically increasing)
+    lo = int(np.searchsorted(times, region_start_ms, side="left"))
+    hi = int(np.searchsorted(times, region_end_ms, side="right"))
 
-    if len(region_indices) == 0:
+    if lo >= hi:
         return None
 
     # Check if energy is above threshold at the start of the region
-    first_idx = region_indices[0]
-    if rms[first_idx] < threshold:
+    if rms[lo] < threshold:
         # Energy already below threshold -- no extension warranted
         return None
 
-    # Scan forward to find where energy drops below threshold
-    for idx in region_indices:
-        if rms[idx] < threshold:
-            # Energy dropped -- return this timestamp plus small padding
-            return float(times[idx]) + ENERGY_END_PADDING_MS
+    # Find the first frame where energy drops below threshold
+    below = np.flatnonzero(rms[lo:hi] < threshold)
+    if below.size:
+        # Energy dropped -- return this timestamp plus small padding
+        return float(times[lo + below[0]]) + ENERGY_END_PADDING_MS
 
     # Energy stayed above threshold through the entire region
     return float(region_end_ms)
@@ -754,10 +1061,12 @@ def tokenize_transcript(
     """
     tokens = []
     unknown_chars = []
+    lookup = dictionary.get
 
     for char in transcript:
-        if char in dictionary:
-            tokens.append(dictionary[char])
+        token = lookup(char)
+        if token is not None:
+            tokens.append(token)
         elif char == " ":
             # Skip spaces
             continue
@@ -778,6 +1087,200 @@ def tokenize_transcript(
     return tokens
 
 
+@dataclass
+class _AlignmentInput:
+    """Preprocessed audio, tokens, and energy analysis for one alignment."""
+
+    audio_path: Path
+    transcript: str
+    waveform: torch.Tensor  # Normalized [1, num_samples] waveform on the host
+    sample_rate: int
+    duration_ms: float
+    tokens: tuple[int, ...]
+    raw_audio: np.ndarray  # Unnormalized samples for energy analysis
+    rms: np.ndarray  # Per-frame RMS energy of raw_audio
+    alignment_params: AlignmentParams | None
+    # Filled in by _analyze_energy while the forward pass runs
+    energy_profile: EnergyProfile | None = None
+    energy_start_ms: float | None = None
+    energy_end_ms: float | None = None
+
+
+def _analyze_energy(item: _AlignmentInput) -> None:
+    """Compute the energy profile and sound boundaries for an input, once.
+
+    Called after the MMS_FA forward pass is queued: on CUDA the kernels run
+    asynchronously, so this CPU work overlaps them.
+    """
+    if item.energy_profile is not None:
+        return
+    (
+        item.energy_profile,
+        item.energy_start_ms,
+        item.energy_end_ms,
+    ) = compute_energy_profile_and_boundaries(
+        item.raw_audio,
+        item.sample_rate,
+        alignment_params=item.alignment_params,
+        rms=item.rms,
+    )
+
+
+def _energy_only_confidence(
+    energy_profile: EnergyProfile,
+    start_ms: float,
+    end_ms: float,
+) -> float:
+    """Confidence for a segment placed from energy boundaries alone.
+
+    Scales ENERGY_ONLY_MAX_CONFIDENCE by how far the segment's mean RMS
+    stands above the release threshold, so a clear sustained sound scores
+    near the cap and one barely above the noise floor scores near zero.
+
+    Args:
+        energy_profile: Energy profile of the sample
+        start_ms: Segment start (ms)
+        end_ms: Segment end (ms)
+
+    Returns:
+        Confidence in [0, ENERGY_ONLY_MAX_CONFIDENCE]
+    """
+    times = energy_profile.times_ms
+    lo = int(np.searchsorted(times, start_ms, side="left"))
+    hi = int(np.searchsorted(times, end_ms, side="right"))
+    if lo >= hi:
+        return 0.0
+
+    mean_rms = float(energy_profile.rms[lo:hi].mean())
+    if mean_rms <= energy_profile.release_threshold:
+        return 0.0
+
+    margin = 1.0 - energy_profile.release_threshold / mean_rms
+    return ENERGY_ONLY_MAX_CONFIDENCE * margin
+
+
+def _inference_autocast(device: torch.device) -> torch.autocast:
+    """Autocast context for the MMS_FA forward pass.
+
+    Runs the encoder in FP16 on CUDA, which roughly halves its memory
+    traffic; CTC alignment is robust to the reduced precision. A no-op on
+    other devices.
+    """
+    return torch.autocast(
+        device_type=device.type,
+        dtype=torch.float16,
+        enabled=device.type == "cuda",
+    )
+
+
+def _batched_emissions(
+    model: torch.nn.Module,
+    waveforms: list[torch.Tensor],
+    device: torch.device,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Run one MMS_FA forward pass over waveforms of differing lengths.
+
+    The MMS_FA bundle wrapper layer-normalizes its whole input tensor, which
+    for a padded batch would mix statistics across items and padding. Each
+    waveform is normalized on its own instead, and the padded batch goes
+    through the wrapped Wav2Vec2 model with per-item lengths so padding is
+    masked out of attention.
+
+    Args:
+        model: MMS_FA model from get_mms_fa_model
+        waveforms: List of [1, num_samples] waveforms
+        device: Device to run the forward pass on
+
+    Returns:
+        Tuple of (emissions, emission_lengths): padded [batch, num_frames,
+        num_tokens] FP32 log-probability emissions and the number of valid
+        frames per waveform. Nothing here waits on the device, so on CUDA the
+        forward pass may still be running when this returns.
+    """
+    # Copy each waveform to the target device, then normalize and pad there
+    normalized = [
+        torch.nn.functional.layer_norm(waveform[0], waveform[0].shape)
+        for waveform in (w.to(device, non_blocking=True) for w in waveforms)
+    ]
+    lengths = torch.tensor([len(w) for w in normalized], device=device)
+    padded = pad_sequence(normalized, batch_first=True)
+
+    with torch.inference_mode(), _inference_autocast(device):
+        emissions, emission_lengths = model.model(padded, lengths)
+        emissions = torch.log_softmax(emissions.float(), dim=-1)
+
+    return emissions, emission_lengths
+
+
+# Host-side (emissions, emission_lengths, ready event) from _emissions_to_host
+_HostEmissions = tuple[torch.Tensor, torch.Tensor, torch.cuda.Event | None]
+
+
+def _emissions_to_host(
+    emissions: torch.Tensor,
+    emission_lengths: torch.Tensor,
+) -> _HostEmissions:
+    """Start copying batched emissions to host memory without blocking.
+
+    forced_align is a sequential dynamic program that runs well on CPU, so
+    aligning there frees the GPU for the next forward pass. The copy goes into
+    page-locked memory so it is truly asynchronous.
+
+    Returns:
+        Tuple of (emissions, emission_lengths, ready) on CPU, where ready is
+        a CUDA event to synchronize on before reading them, or None if they
+        were already on CPU
+    """
+    if emissions.device.type != "cuda":
+        return emissions, emission_lengths, None
+
+    host_emissions = torch.empty(
+        emissions.shape, dtype=emissions.dtype, pin_memory=True
+    ).copy_(emissions, non_blocking=True)
+    host_lengths = torch.empty(
+        emission_lengths.shape, dtype=emission_lengths.dtype, pin_memory=True
+    ).copy_(emission_lengths, non_blocking=True)
+    # The copies run on the emissions' device stream, which need not be the
+    # current device's: the model is pinned to cuda:0
+    ready = torch.cuda.Event()
+    ready.record(torch.cuda.current_stream(emissions.device))
+    return host_emissions, host_lengths, ready
+
+
+def _length_buckets(
+    lengths: list[int],
+    batch_size: int,
+    max_length_ratio: float,
+) -> list[list[int]]:
+    """Group indices into batches of similar length to limit padding.
+
+    Indices are sorted by length and cut into consecutive runs of at most
+    batch_size, starting a new run early whenever the next length exceeds
+    max_length_ratio times the shortest length in the current run.
+
+    Args:
+        lengths: Length of each item
+        batch_size: Maximum number of items per bucket
+        max_length_ratio: Maximum longest/shortest length ratio per bucket
+
+    Returns:
+        List of buckets, each a list of indices into lengths
+    """
+    buckets: list[list[int]] = []
+    current: list[int] = []
+    for index in sorted(range(len(lengths)), key=lengths.__getitem__):
+        if current and (
+            len(current) >= batch_size
+            or lengths[index] > max_length_ratio * lengths[current[0]]
+        ):
+            buckets.append(current)
+            current = []
+        current.append(index)
+    if current:
+        buckets.append(current)
+    return buckets
+
+
 class ForcedAlignmentDetector:
     """Phoneme detector using TorchAudio's MMS_FA forced alignment.
 
@@ -803,13 +1306,69 @@ class ForcedAlignmentDetector:
         """Initialize the forced alignment detector."""
         self._model: torch.nn.Module | None = None
         self._dictionary: dict[str, int] | None = None
+        # Serializes use of the model: a CPU fallback moves it off the GPU
+        # mid-inference. The model is a process-wide singleton that another
+        # detector's fallback can move too, so each inference reads its device
+        # from the model's parameters instead of caching it.
+        self._inference_lock = threading.Lock()
+        # Token IDs per transcript; many samples in a voicebank share one
+        self._token_cache: dict[str, tuple[int, ...]] = {}
+        # Preprocessed audio per (path, mtime), least recently used first
+        self._audio_cache: OrderedDict[
+            tuple[Path, int],
+            tuple[torch.Tensor, int, float, np.ndarray, np.ndarray],
+        ] = OrderedDict()
+        self._audio_cache_lock = threading.Lock()
 
     def _ensure_model_loaded(self) -> tuple[torch.nn.Module, dict[str, int]]:
         """Ensure model is loaded, loading lazily if needed."""
         if self._model is None or self._dictionary is None:
             self._model, self._dictionary = get_mms_fa_model()
+            self._token_cache.clear()
         return self._model, self._dictionary
 
+    def _tokenize(self, transcript: str, dictionary: dict[str, int]) -> tuple[int, ...]:
+        """Tokenize a transcript, reusing the result for repeated transcripts.
+
+        Raises:
+            ForcedAlignmentError: If the transcript has no valid tokens
+        """
+        tokens = self._token_cache.get(transcript)
+        if tokens is None:
+            tokens = tuple(tokenize_transcript(transcript, dictionary))
+            self._token_cache[transcript] = tokens
+        return tokens
+
+    def _load_audio(
+        self, audio_path: Path
+    ) -> tuple[torch.Tensor, int, float, np.ndarray, np.ndarray]:
+        """Preprocess an audio file, reusing the result while it is unmodified.
+
+        Cached arrays are shared between calls and must not be modified.
+
+        Raises:
+            ForcedAlignmentError: If the audio cannot be processed
+        """
+        try:
+            key = (audio_path, audio_path.stat().st_mtime_ns)
+        except OSError:
+            # Let preprocessing report the missing/unreadable file
+            return preprocess_audio_for_alignment(audio_path)
+
+        with self._audio_cache_lock:
+            cached = self._audio_cache.get(key)
+            if cached is not None:
+                self._audio_cache.move_to_end(key)
+                return cached
+
+        # Preprocess outside the lock so worker threads load files in parallel
+        preprocessed = preprocess_audio_for_alignment(audio_path)
+        with self._audio_cache_lock:
+            self._audio_cache[key] = preprocessed
+            if len(self._audio_cache) > PREPROCESSED_AUDIO_CACHE_SIZE:
+                self._audio_cache.popitem(last=False)
+        return preprocessed
+
     async def detect_phonemes(
         self,
         audio_path: Path,
@@ -855,6 +1414,9 @@ class ForcedAlignmentDetector:
         where each vowel may be sustained. Each vowel is extended up to where
         energy drops below threshold, capped at the next segment's start.
 
+        Single-phoneme transcripts (e.g. "a") skip forced alignment: the
+        phoneme is placed at the energy-detected sound boundaries.
+
         Args:
             audio_path: Path to the audio file (WAV recommended)
             transcript: Expected text/phonemes in the audio
@@ -869,100 +1431,91 @@ class ForcedAlignmentDetector:
             ForcedAlignmentError: If alignment fails
         """
         model, dictionary = self._ensure_model_loaded()
-        device = next(model.parameters()).device
 
-        # Load and preprocess audio
-        waveform, sample_rate, duration_ms, raw_audio = preprocess_audio_for_alignment(
-            audio_path
+        item = self._prepare_alignment_input(
+            audio_path, transcript, dictionary, alignment_params
         )
-        waveform = waveform.to(device)
-
-        # Detect energy-based sound boundaries for global start/end
-        energy_start_ms, energy_end_ms = detect_energy_boundaries(
-            raw_audio, sample_rate, alignment_params=alignment_params
-        )
-
-        # Compute per-frame energy profile for per-segment extension
-        energy_profile = compute_energy_profile(
-            raw_audio, sample_rate, alignment_params=alignment_params
-        )
-
-        # Tokenize transcript
-        tokens = tokenize_transcript(transcript, dictionary)
-
-        def _gpu_inference() -> tuple[torch.Tensor, torch.Tensor, list]:
-            with torch.inference_mode():
-                emission, _ = model(waveform)
-            targets = torch.tensor([tokens], dtype=torch.int32, device=device)
+        if len(item.tokens) == 1:
+            return self._single_phoneme_result(item)
+
+        tokens = item.tokens
+
+        def _align(
+            run_device: torch.device, run_waveform: torch.Tensor
+        ) -> tuple[torch.Tensor, list]:
+            with torch.inference_mode(), _inference_autocast(run_device):
+                emission, _ = model(run_waveform)
+            # Energy analysis overlaps the (asynchronous) forward pass; it must
+            # come before anything below that waits on the device
+            _analyze_energy(item)
+            # forced_align runs in FP32
+            emission = emission.float()
+            targets = torch.tensor([tokens], dtype=torch.int32, device=run_device)
             alignments, scores = F.forced_align(emission, targets, blank=0)
             token_spans = F.merge_tokens(alignments[0], scores[0].exp())
-            return emission, waveform, token_spans
+            return emission, token_spans
 
         def _cpu_inference(
             cpu_tensors: dict[str, torch.Tensor],
-        ) -> tuple[torch.Tensor, torch.Tensor, list]:
-            cpu_waveform = cpu_tensors["waveform"]
-            cpu_device = torch.device("cpu")
-            with torch.inference_mode():
-                emission, _ = model(cpu_waveform)
-            targets = torch.tensor([tokens], dtype=torch.int32, device=cpu_device)
-            alignments, scores = F.forced_align(emission, targets, blank=0)
-            token_spans = F.merge_tokens(alignments[0], scores[0].exp())
-            return emission, cpu_waveform, token_spans
+        ) -> tuple[torch.Tensor, list]:
+            # The fallback leaves the model on CPU; restore FP32 weights, as
+            # autocast is CUDA-only here
+            model.float()
+            return _align(torch.device("cpu"), cpu_tensors["waveform"])
+
+        def _locked_inference() -> tuple[torch.Tensor, list]:
+            with self._inference_lock:
+                device = next(model.parameters()).device
+                # item.waveform stays the host tensor, which the CPU fallback
+                # reuses instead of copying back.
+                waveform = item.waveform.to(device, non_blocking=True)
+                return run_inference_with_cpu_fallback(
+                    model=model,
+                    inference_fn=lambda: _align(device, waveform),
+                    tensors_to_move={"waveform": item.waveform},
+                    cpu_inference_fn=_cpu_inference,
+                    context="MMS_FA forced alignment",
+                    cpu_quantize=get_settings().mms_fa_quantize_cpu,
+                )
 
         try:
-            emission, used_waveform, token_spans = run_inference_with_cpu_fallback(
-                model=model,
-                inference_fn=_gpu_inference,
-                tensors_to_move={"waveform": waveform},
-                cpu_inference_fn=_cpu_inference,
-                context="MMS_FA forced alignment",
-            )
-
-            # Convert to PhonemeSegments with energy-corrected boundaries
-            segments = self._spans_to_segments(
-                token_spans,
-                transcript,
-                used_waveform.size(1),
-                emission.size(1),
-                sample_rate,
-                energy_start_ms=energy_start_ms,
-                energy_end_ms=energy_end_ms,
-                energy_profile=energy_profile,
-            )
-
-            return PhonemeDetectionResult(
-                segments=segments,
-                audio_duration_ms=duration_ms,
-                model_name="torchaudio-mms-fa",
-            )
+            # Run on a worker thread, like the batch path, so waiting for the
+            # inference lock never blocks the event loop
+            emission, token_spans = await asyncio.to_thread(_locked_inference)
+            return self._result_from_spans(item, token_spans, emission.size(1))
 
         except Exception as e:
             logger.exception(f"Forced alignment failed for {audio_path}")
             raise ForcedAlignmentError(f"Forced alignment failed: {e}") from e
 
-        finally:
-            # Clean up GPU memory
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-
     async def batch_detect_phonemes(
         self,
         items: list[tuple[Path, str]],
         alignment_params: AlignmentParams | None = None,
+        batch_size: int = ALIGNMENT_BATCH_SIZE,
+        max_length_ratio: float = ALIGNMENT_BUCKET_MAX_LENGTH_RATIO,
     ) -> dict[Path, PhonemeDetectionResult]:
         """Detect phonemes for multiple audio files in batch.
 
-        Pre-loads the model once, then processes each (audio_path, transcript)
-        pair sequentially. Individual failures are logged and skipped.
+        Pre-loads the model, then works through the items in chunks of
+        ALIGNMENT_BATCHES_PER_CHUNK batches. Each chunk's audio is loaded on
+        worker threads, sorted by length and run through the MMS_FA forward
+        pass in buckets of up to batch_size files of similar length, padding
+        each bucket into a single tensor. Forced alignment itself still runs
+        per file on that file's slice of the emissions. Individual failures
+        are logged and skipped.
 
         Args:
             items: List of (audio_path, transcript) pairs
             alignment_params: Optional alignment parameters for energy threshold
                 tuning applied to all items.
+            batch_size: Maximum number of files per forward pass
+            max_length_ratio: Maximum longest/shortest waveform length ratio
+                within one forward pass
 
         Returns:
-            Dict mapping successful audio paths to their PhonemeDetectionResult
+            Dict mapping successful audio paths to their PhonemeDetectionResult,
+            in input order
 
         Raises:
             ForcedAlignmentError: If ALL files fail alignment
@@ -971,20 +1524,31 @@ class ForcedAlignmentDetector:
             return {}
 
         # Pre-load model once for entire batch
-        self._ensure_model_loaded()
+        model, dictionary = self._ensure_model_loaded()
 
         results: dict[Path, PhonemeDetectionResult] = {}
         failed: list[tuple[Path, Exception]] = []
 
-        for audio_path, transcript in items:
-            try:
-                result = await self.detect_phonemes_with_transcript(
-                    audio_path, transcript, alignment_params=alignment_params
-                )
-                results[audio_path] = result
-            except (ForcedAlignmentError, TranscriptExtractionError) as e:
-                logger.warning(f"MMS_FA alignment failed for {audio_path.name}: {e}")
-                failed.append((audio_path, e))
+        # Load and align a few batches at a time, so only one chunk of
+        # preprocessed audio is held in memory however large the input is.
+        # Chunks run in input order, which keeps results in input order.
+        chunk_size = batch_size * ALIGNMENT_BATCHES_PER_CHUNK
+        for chunk_start in range(0, len(items), chunk_size):
+            await self._batch_detect_chunk(
+                model,
+                dictionary,
+                items[chunk_start : chunk_start + chunk_size],
+                alignment_params,
+                batch_size,
+                max_length_ratio,
+                results,
+                failed,
+            )
+
+        # Clean up GPU memory once per batch. Single-file detection leaves
+        # blocks to the caching allocator so repeated calls can reuse them.
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
 
         # Log summary
         total = len(items)
@@ -1003,6 +1567,295 @@ class ForcedAlignmentDetector:
 
         return results
 
+    async def _batch_detect_chunk(
+        self,
+        model: torch.nn.Module,
+        dictionary: dict[str, int],
+        items: list[tuple[Path, str]],
+        alignment_params: AlignmentParams | None,
+        batch_size: int,
+        max_length_ratio: float,
+        results: dict[Path, PhonemeDetectionResult],
+        failed: list[tuple[Path, Exception]],
+    ) -> None:
+        """Load, bucket and align one chunk of batch_detect_phonemes input.
+
+        Successful results are added to results in input order; failures are
+        logged and appended to failed.
+        """
+        # Decode and resample on worker threads: files load in parallel and
+        # the event loop stays responsive meanwhile
+        loaded = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._prepare_alignment_input,
+                    audio_path,
+                    transcript,
+                    dictionary,
+                    alignment_params,
+                )
+                for audio_path, transcript in items
+            ),
+            return_exceptions=True,
+        )
+
+        prepared: list[_AlignmentInput] = []
+        for (audio_path, _), outcome in zip(items, loaded, strict=True):
+            if isinstance(outcome, ForcedAlignmentError | TranscriptExtractionError):
+                logger.warning(
+                    f"MMS_FA alignment failed for {audio_path.name}: {outcome}"
+                )
+                failed.append((audio_path, outcome))
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                prepared.append(outcome)
+
+        # Single-phoneme transcripts need no forced alignment
+        outcomes: dict[int, PhonemeDetectionResult | ForcedAlignmentError] = {
+            i: self._single_phoneme_result(item)
+            for i, item in enumerate(prepared)
+            if len(item.tokens) == 1
+        }
+        to_align = [i for i in range(len(prepared)) if i not in outcomes]
+
+        # Batch files of similar length so each forward pass pads little
+        buckets = [
+            [to_align[j] for j in bucket]
+            for bucket in _length_buckets(
+                [prepared[i].waveform.size(1) for i in to_align],
+                batch_size,
+                max_length_ratio,
+            )
+        ]
+        outcomes.update(
+            await asyncio.to_thread(self._align_buckets, model, prepared, buckets)
+        )
+
+        # Report outcomes in input order, not bucket order
+        for i, item in enumerate(prepared):
+            outcome = outcomes[i]
+            if isinstance(outcome, ForcedAlignmentError):
+                logger.warning(
+                    f"MMS_FA alignment failed for {item.audio_path.name}: {outcome}"
+                )
+                failed.append((item.audio_path, outcome))
+            else:
+                results[item.audio_path] = outcome
+
+    def _prepare_alignment_input(
+        self,
+        audio_path: Path,
+        transcript: str,
+        dictionary: dict[str, int],
+        alignment_params: AlignmentParams | None,
+    ) -> _AlignmentInput:
+        """Load audio and tokenize the transcript.
+
+        Energy analysis is deferred to _analyze_energy so it can overlap the
+        forward pass.
+
+        Raises:
+            ForcedAlignmentError: If the audio cannot be processed or the
+                transcript has no valid tokens
+        """
+        # Load and preprocess audio (RMS energy is computed in the same pass)
+        (
+            waveform,
+            sample_rate,
+            duration_ms,
+            raw_audio,
+            rms,
+        ) = self._load_audio(audio_path)
+
+        return _AlignmentInput(
+            audio_path=audio_path,
+            transcript=transcript,
+            waveform=waveform,
+            sample_rate=sample_rate,
+            duration_ms=duration_ms,
+            tokens=self._tokenize(transcript, dictionary),
+            raw_audio=raw_audio,
+            rms=rms,
+            alignment_params=alignment_params,
+        )
+
+    def _align_buckets(
+        self,
+        model: torch.nn.Module,
+        prepared: list[_AlignmentInput],
+        buckets: list[list[int]],
+    ) -> dict[int, PhonemeDetectionResult | ForcedAlignmentError]:
+        """Align prepared inputs one bucket per forward pass.
+
+        Each bucket's forward pass is launched before the previous bucket is
+        aligned, so on CUDA the energy analysis and CPU-side forced alignment
+        of one bucket overlap the encoder of the next. Holds the inference
+        lock throughout, as it runs on a worker thread.
+
+        Returns:
+            Mapping from index into prepared to the detection result, or the
+            ForcedAlignmentError describing why that input failed
+        """
+        outcomes: dict[int, PhonemeDetectionResult | ForcedAlignmentError] = {}
+
+        def _collect(
+            bucket: list[int],
+            batch: list[_AlignmentInput],
+            launched: _HostEmissions | ForcedAlignmentError,
+        ) -> None:
+            for i, outcome in zip(
+                bucket, self._align_emissions(batch, launched), strict=True
+            ):
+                outcomes[i] = outcome
+
+        pending = None
+        with self._inference_lock:
+            for bucket in buckets:
+                batch = [prepared[i] for i in bucket]
+                launched = self._launch_batch(model, batch)
+                if pending is not None:
+                    _collect(*pending)
+                pending = (bucket, batch, launched)
+            if pending is not None:
+                _collect(*pending)
+
+        return outcomes
+
+    def _launch_batch(
+        self,
+        model: torch.nn.Module,
+        batch: list[_AlignmentInput],
+    ) -> _HostEmissions | ForcedAlignmentError:
+        """Start one shared forward pass for a batch of prepared inputs.
+
+        Returns:
+            The host-side (emissions, emission_lengths, ready) from
+            _emissions_to_host, or the ForcedAlignmentError shared by every
+            input if the forward pass failed
+        """
+        waveforms = [item.waveform for item in batch]
+        device = next(model.parameters()).device
+
+        def _gpu_inference() -> tuple[torch.Tensor, torch.Tensor]:
+            return _batched_emissions(model, waveforms, device)
+
+        def _cpu_inference(
+            _: dict[str, torch.Tensor],
+        ) -> tuple[torch.Tensor, torch.Tensor]:
+            # The fallback leaves the model on CPU; restore FP32 weights, as
+            # autocast is CUDA-only here
+            model.float()
+            return _batched_emissions(model, waveforms, torch.device("cpu"))
+
+        try:
+            emissions, emission_lengths = run_inference_with_cpu_fallback(
+                model=model,
+                inference_fn=_gpu_inference,
+                cpu_inference_fn=_cpu_inference,
+                context="MMS_FA batched forced alignment",
+                cpu_quantize=get_settings().mms_fa_quantize_cpu,
+            )
+            return _emissions_to_host(emissions, emission_lengths)
+        except Exception as e:
+            logger.exception(f"Batched forward pass failed for {len(batch)} files")
+            return ForcedAlignmentError(f"Forced alignment failed: {e}")
+
+    def _align_emissions(
+        self,
+        batch: list[_AlignmentInput],
+        launched: _HostEmissions | ForcedAlignmentError,
+    ) -> list[PhonemeDetectionResult | ForcedAlignmentError]:
+        """Run forced alignment for a batch launched by _launch_batch.
+
+        Returns:
+            One entry per input, in order: the detection result, or the
+            ForcedAlignmentError describing why that input failed
+        """
+        if isinstance(launched, ForcedAlignmentError):
+            return [launched] * len(batch)
+        emissions, emission_lengths, ready = launched
+
+        # Energy analysis overlaps the (asynchronous) forward pass and copy;
+        # it must come before waiting on them
+        for item in batch:
+            _analyze_energy(item)
+        if ready is not None:
+            ready.synchronize()
+
+        # Targets for the whole batch share one tensor; each item aligns
+        # against a view of its own tokens
+        all_targets = torch.tensor(
+            [token for item in batch for token in item.tokens], dtype=torch.int32
+        ).split([len(item.tokens) for item in batch])
+
+        outcomes: list[PhonemeDetectionResult | ForcedAlignmentError] = []
+        for i, (item, num_frames, targets) in enumerate(
+            zip(batch, emission_lengths.tolist(), all_targets, strict=True)
+        ):
+            emission = emissions[i : i + 1, :num_frames]
+            try:
+                alignments, scores = F.forced_align(
+                    emission, targets.unsqueeze(0), blank=0
+                )
+                token_spans = F.merge_tokens(alignments[0], scores[0].exp())
+                outcomes.append(
+                    self._result_from_spans(item, token_spans, emission.size(1))
+                )
+            except Exception as e:
+                outcomes.append(ForcedAlignmentError(f"Forced alignment failed: {e}"))
+        return outcomes
+
+    def _result_from_spans(
+        self,
+        item: _AlignmentInput,
+        token_spans: list,
+        num_frames: int,
+    ) -> PhonemeDetectionResult:
+        """Build the detection result for one input from its token spans."""
+        # Convert to PhonemeSegments with energy-corrected boundaries
+        segments = self._spans_to_segments(
+            token_spans,
+            item.transcript,
+            item.waveform.size(1),
+            num_frames,
+            item.sample_rate,
+            energy_start_ms=item.energy_start_ms,
+            energy_end_ms=item.energy_end_ms,
+            energy_profile=item.energy_profile,
+        )
+
+        return PhonemeDetectionResult(
+            segments=segments,
+            audio_duration_ms=item.duration_ms,
+            model_name="torchaudio-mms-fa",
+        )
+
+    def _single_phoneme_result(self, item: _AlignmentInput) -> PhonemeDetectionResult:
+        """Build the detection result for a single-token transcript.
+
+        With only one phoneme to place there is nothing for forced alignment
+        to decide: the phoneme spans the detected sound. This skips the MMS_FA
+        forward pass, which is most of the cost for CV samples like _a.wav.
+        The confidence comes from the energy region, as there is no alignment
+        score.
+        """
+        _analyze_energy(item)
+        segment = PhonemeSegment(
+            # Same character _spans_to_segments would label the span with
+            phoneme=next(c for c in item.transcript if c != " "),
+            start_ms=item.energy_start_ms,
+            end_ms=item.energy_end_ms,
+            confidence=_energy_only_confidence(
+                item.energy_profile, item.energy_start_ms, item.energy_end_ms
+            ),
+        )
+        return PhonemeDetectionResult(
+            segments=[segment],
+            audio_duration_ms=item.duration_ms,
+            model_name=ENERGY_ONLY_MODEL_NAME,
+        )
+
     def _spans_to_segments(
         self,
         token_spans: list,
@@ -1067,57 +1920,57 @@ class ForcedAlignmentDetector:
 
         # Second pass: apply corrections with knowledge of all segment positions
         segments: list[PhonemeSegment] = []
+        last_index = len(raw_timings) - 1
 
         for i, (phoneme, start_ms, end_ms, confidence) in enumerate(raw_timings):
-            is_first_segment = i == 0
-            is_last_segment = i == len(raw_timings) - 1
-
             # For the first segment, check if FA detected it too late
             # This happens when the model struggles with certain vowels
-            if is_first_segment and energy_start_ms is not None:
+            if i == 0 and energy_start_ms is not None:
                 offset = start_ms - energy_start_ms
                 if offset > MAX_FA_ENERGY_OFFSET_MS:
                     # FA detected phoneme much later than sound start
                     # Use energy-detected start instead
                     logger.debug(
-                        f"FA start ({start_ms:.1f}ms) is {offset:.1f}ms after "
-                        f"energy start ({energy_start_ms:.1f}ms), using energy start"
+                        "FA start (%.1fms) is %.1fms after energy start (%.1fms), "
+                        "using energy start",
+                        start_ms,
+                        offset,
+                        energy_start_ms,
                     )
                     start_ms = energy_start_ms
 
             # For non-first segments, check for unreasonable gaps
-            if not is_first_segment and len(segments) > 0:
+            if segments:
                 prev_segment = segments[-1]
                 gap = start_ms - prev_segment.end_ms
                 if gap > MAX_SEGMENT_GAP_MS:
                     # Gap is too large, assume phoneme should follow previous
-                    adjusted_start = (
-                        prev_segment.end_ms + 10
-                    )  # Small gap for transition
+                    adjusted_start = prev_segment.end_ms + 10  # Small transition gap
                     logger.debug(
-                        f"Gap ({gap:.1f}ms) after '{prev_segment.phoneme}' is too large, "
-                        f"adjusting '{phoneme}' start from {start_ms:.1f}ms to {adjusted_start:.1f}ms"
+                        "Gap (%.1fms) after '%s' is too large, adjusting '%s' start "
+                        "from %.1fms to %.1fms",
+                        gap,
+                        prev_segment.phoneme,
+                        phoneme,
+                        start_ms,
+                        adjusted_start,
                     )
                     start_ms = adjusted_start
 
-            # Energy-based vowel extension
-            is_vowel = phoneme.lower() in VOWEL_CHARACTERS
-
-            if is_last_segment and energy_end_ms is not None:
-                # Final segment: extend to global energy-detected sound end
-                # (applies to any final phoneme, vowel or not, preserving
-                # original behavior)
-                end_ms = max(end_ms, energy_end_ms)
+            if i == last_index:
+                if energy_end_ms is not None:
+                    # Final segment: extend to global energy-detected sound end
+                    # (applies to any final phoneme, vowel or not, preserving
+                    # original behavior)
+                    end_ms = max(end_ms, energy_end_ms)
 
-            elif is_vowel and not is_last_segment and energy_profile is not None:
+            elif phoneme in _VOWEL_LOOKUP and energy_profile is not None:
                 # Non-final vowel: use energy profile to find actual sustain end
                 # Cap extension at the next segment's raw FA start time so we
-                # don't encroach into the next phoneme's territory
-                next_start_ms = raw_timings[i + 1][1]
-                # Also respect any gap-adjusted start that might apply to the
-                # next segment. Use the raw FA start as the hard cap since gap
-                # adjustment only moves starts earlier, not later.
-                cap_ms = next_start_ms
+                # don't encroach into the next phoneme's territory. Gap
+                # adjustment only moves starts earlier, so the raw start is the
+                # hard cap. Consonant segments are never extended.
+                cap_ms = raw_timings[i + 1][1]
 
                 energy_end = find_energy_end_in_region(
                     energy_profile,
@@ -1127,9 +1980,13 @@ class ForcedAlignmentDetector:
 
                 if energy_end is not None and energy_end > end_ms:
                     logger.debug(
-                        f"Extending vowel '{phoneme}' (segment {i}) end from "
-                        f"{end_ms:.1f}ms to {energy_end:.1f}ms "
-                        f"(capped at next segment start {cap_ms:.1f}ms)"
+                        "Extending vowel '%s' (segment %d) end from %.1fms to "
+                        "%.1fms (capped at next segment start %.1fms)",
+                        phoneme,
+                        i,
+                        end_ms,
+                        energy_end,
+                        cap_ms,
                     )
                     # Ensure we don't exceed the cap even with padding
                     end_ms = min(energy_end, cap_ms)
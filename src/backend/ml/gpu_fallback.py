@@ -1,9 +1,9 @@
 """GPU OOM graceful fallback utilities for ML inference.
 
 When CUDA runs out of memory during inference, these utilities catch the
-RuntimeError, clean up GPU memory, move the model and inputs to CPU, and
-retry inference. This prevents entire batches from failing due to transient
-GPU memory pressure.
+RuntimeError, clean up GPU memory and retry once on the GPU, then move the
+model and inputs to CPU and retry inference there. This prevents entire
+batches from failing due to transient GPU memory pressure.
 
 Usage:
     from src.backend.ml.gpu_fallback import run_inference_with_cpu_fallback
@@ -15,17 +15,50 @@ Usage:
     )
 """
 
+import gc
 import logging
+import os
+import re
 from collections.abc import Callable
 from typing import TypeVar
 
 import torch
 
+from src.backend.config import get_settings
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
+def _apply_cuda_tuning() -> None:
+    """Apply the process-wide CUDA tuning enabled by Settings.cuda_tuning.
+
+    Runs once at import. PyTorch reads PYTORCH_CUDA_ALLOC_CONF at the first
+    CUDA allocation, and every ML module imports this module before using
+    the GPU, so the allocator setting takes effect for all models.
+    """
+    # Let the CUDA caching allocator grow segments in place instead of
+    # fragmenting, so fewer borderline OOMs reach the (slow) CPU fallback.
+    # An explicit user setting wins.
+    os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
+    # Let FP32 matmuls use TF32 tensor cores (Ampere and newer; ignored
+    # elsewhere). This affects models that run FP32 on the GPU, such as SOFA;
+    # MMS_FA runs FP16 under autocast and is unaffected.
+    torch.backends.cuda.matmul.allow_tf32 = True
+
+
+if get_settings().cuda_tuning:
+    _apply_cuda_tuning()
+
+# "out of memory", or "cuda" and "alloc" in either order, matched in one
+# case-insensitive pass without lowercasing a copy of the message
+_CUDA_OOM_RE = re.compile(
+    r"out of memory|cuda.*alloc|alloc.*cuda", re.IGNORECASE | re.DOTALL
+)
+
+
 def is_cuda_oom(error: RuntimeError) -> bool:
     """Check if a RuntimeError is a CUDA out-of-memory error.
 
@@ -38,33 +71,81 @@ def is_cuda_oom(error: RuntimeError) -> bool:
     Returns:
         True if the error is a CUDA OOM error
     """
-    message = str(error).lower()
-    return "out of memory" in message or ("cuda" in message and "alloc" in message)
+    return _CUDA_OOM_RE.search(str(error)) is not None
+
+
+def _synchronize_if_cuda() -> None:
+    """Wait for pending non-blocking device-to-host copies to land."""
+    # Without an initialized CUDA context no copy can be pending
+    if torch.cuda.is_initialized():
+        torch.cuda.synchronize()
+
+
+def _release_cuda_cache() -> None:
+    """Return cached CUDA blocks to the driver, if there are any.
+
+    empty_cache() takes the allocator lock and can stall for milliseconds,
+    so it is skipped when CUDA was never initialized (the OOM-like error did
+    not come from the GPU) or the caching allocator holds no memory.
+    """
+    if torch.cuda.is_initialized() and torch.cuda.memory_reserved() > 0:
+        torch.cuda.empty_cache()
 
 
 def move_model_to_cpu(model: torch.nn.Module) -> torch.nn.Module:
     """Move a model to CPU and return it.
 
+    Parameters are copied with non_blocking=True (PyTorch stages
+    device-to-host copies in pinned memory) and waited on once, rather
+    than synchronizing after every tensor.
+
     Args:
         model: The PyTorch model to move
 
     Returns:
         The model on CPU
     """
-    model.to(torch.device("cpu"))
+    model.to(torch.device("cpu"), non_blocking=True)
+    _synchronize_if_cuda()
     return model
 
 
 def move_tensors_to_cpu(tensors: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
     """Move a dictionary of tensors to CPU.
 
+    All copies are queued non-blocking before a single synchronize.
+
     Args:
         tensors: Dictionary mapping names to tensors
 
     Returns:
         New dictionary with all tensors moved to CPU
     """
-    return {name: t.to(torch.device("cpu")) for name, t in tensors.items()}
+    cpu = torch.device("cpu")
+    moved = {name: t.to(cpu, non_blocking=True) for name, t in tensors.items()}
+    _synchronize_if_cuda()
+    return moved
+
+
+def quantize_model_for_cpu(model: torch.nn.Module) -> torch.nn.Module:
+    """Dynamically quantize a CPU model's Linear layers to int8, in place.
+
+    Reduced-precision (FP16/BF16) weights are restored to FP32 first, as
+    dynamic quantization expects FP32 weights. Activations stay FP32.
+
+    Args:
+        model: The PyTorch model, already on CPU
+
+    Returns:
+        The same model object with its Linear layers quantized
+    """
+    if any(
+        p.dtype != torch.float32 for p in model.parameters() if p.is_floating_point()
+    ):
+        model.float()
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
 
 
 def run_inference_with_cpu_fallback(
@@ -73,17 +154,22 @@ def run_inference_with_cpu_fallback(
     tensors_to_move: dict[str, torch.Tensor] | None = None,
     cpu_inference_fn: Callable[[dict[str, torch.Tensor]], T] | None = None,
     context: str = "",
+    cpu_quantize: bool = False,
 ) -> T:
     """Run GPU inference with automatic CPU fallback on CUDA OOM.
 
     First attempts to run inference_fn on the current device (typically GPU).
-    If a CUDA OOM RuntimeError occurs, cleans up GPU memory, moves the model
-    and tensors to CPU, and retries using cpu_inference_fn.
+    If a CUDA OOM RuntimeError occurs, collects garbage, releases the CUDA
+    cache and retries inference_fn once on the GPU, since an OOM is often
+    caused by fragmentation or memory still held by a previous call. Only
+    if that retry also runs out of memory are the model and tensors moved
+    to CPU and inference retried using cpu_inference_fn.
 
     Args:
         model: The PyTorch model (will be moved to CPU on OOM)
         inference_fn: Callable that runs the GPU inference and returns results.
-                     Called with no arguments on the first (GPU) attempt.
+                     Called with no arguments on the first (GPU) attempt and
+                     on the GPU retry, so it must be safe to call twice.
         tensors_to_move: Optional dict of named tensors that need to be moved
                         to CPU alongside the model. Keys are names for logging,
                         values are the tensors.
@@ -95,6 +181,10 @@ def run_inference_with_cpu_fallback(
                          references that get updated by the move).
         context: Optional string describing the inference for log messages
                 (e.g., "Wav2Vec2 phoneme detection", "SOFA alignment").
+        cpu_quantize: If True, the model's Linear layers are dynamically
+                     quantized to int8 in place after the move to CPU, which
+                     roughly halves CPU inference time at a small accuracy
+                     cost. The model stays quantized for later calls.
 
     Returns:
         The result of inference_fn or cpu_inference_fn
@@ -105,36 +195,57 @@ def run_inference_with_cpu_fallback(
     """
     ctx = f" ({context})" if context else ""
 
+    # Retries happen outside the except blocks so the caught exception and
+    # its traceback (which pin the failed attempt's GPU tensors) are released
+    # before memory is freed.
     try:
         return inference_fn()
     except RuntimeError as e:
         if not is_cuda_oom(e):
             raise
 
-        logger.warning(
-            f"CUDA out of memory during inference{ctx}. "
-            "Falling back to CPU. This will be slower but should complete."
+    logger.warning(
+        "CUDA out of memory during inference%s. "
+        "Freeing cached GPU memory and retrying on GPU.",
+        ctx,
+    )
+
+    # Clean up GPU memory
+    gc.collect()
+    _release_cuda_cache()
+
+    try:
+        return inference_fn()
+    except RuntimeError as e:
+        if not is_cuda_oom(e):
+            raise
+
+    logger.warning(
+        "CUDA out of memory again during inference%s. "
+        "Falling back to CPU. This will be slower but should complete.",
+        ctx,
+    )
+
+    _release_cuda_cache()
+
+    # Move model to CPU
+    move_model_to_cpu(model)
+    if cpu_quantize:
+        quantize_model_for_cpu(model)
+        logger.info("Model moved to CPU with int8 dynamic quantization%s", ctx)
+    else:
+        logger.info("Model moved to CPU%s", ctx)
+
+    # Move tensors to CPU
+    cpu_tensors: dict[str, torch.Tensor] = {}
+    if tensors_to_move:
+        cpu_tensors = move_tensors_to_cpu(tensors_to_move)
+        logger.debug(
+            "Moved %d tensor(s) to CPU: %s", len(cpu_tensors), list(cpu_tensors)
         )
 
-        # Clean up GPU memory
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-
-        # Move model to CPU
-        move_model_to_cpu(model)
-        logger.info(f"Model moved to CPU{ctx}")
-
-        # Move tensors to CPU
-        cpu_tensors: dict[str, torch.Tensor] = {}
-        if tensors_to_move:
-            cpu_tensors = move_tensors_to_cpu(tensors_to_move)
-            logger.debug(
-                f"Moved {len(cpu_tensors)} tensor(s) to CPU: "
-                f"{list(cpu_tensors.keys())}"
-            )
-
-        # Retry on CPU
-        if cpu_inference_fn is not None:
-            return cpu_inference_fn(cpu_tensors)
-        else:
-            return inference_fn()
+    # Retry on CPU
+    if cpu_inference_fn is not None:
+        return cpu_inference_fn(cpu_tensors)
+    else:
+        return inference_fn()
@@ -19,8 +19,11 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +31,7 @@ logger = logging.getLogger(__name__)
 _PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """Configuration for a single ML model.
 
@@ -67,7 +70,7 @@ class ModelConfig:
 #   2. Run `script/models` to re-download
 #   3. Run tests to verify behavior hasn't regressed
 
-MODEL_REGISTRY: dict[str, ModelConfig] = {
+_MODEL_ENTRIES: dict[str, ModelConfig] = {
     # -----------------------------------------------------------------------
     # HuggingFace models (pinned by commit hash)
     # -----------------------------------------------------------------------
@@ -120,6 +123,12 @@ MODEL_REGISTRY: dict[str, ModelConfig] = {
     ),
 }
 
+# Read-only view; entries are only changed by editing this module
+MODEL_REGISTRY: Mapping[str, ModelConfig] = MappingProxyType(_MODEL_ENTRIES)
+
+# Listed in lookup errors; built once since the registry never changes
+_AVAILABLE_MODEL_KEYS = ", ".join(sorted(MODEL_REGISTRY))
+
 
 # ---------------------------------------------------------------------------
 # SOFA cache TTL (configurable via environment variable)
@@ -147,13 +156,15 @@ def get_sofa_cache_ttl() -> int:
             if ttl > 0:
                 return ttl
             logger.warning(
-                f"SOFA_CACHE_TTL_SECONDS must be positive, got {ttl}. "
-                f"Using default: {DEFAULT_SOFA_CACHE_TTL_SECONDS}"
+                "SOFA_CACHE_TTL_SECONDS must be positive, got %d. Using default: %d",
+                ttl,
+                DEFAULT_SOFA_CACHE_TTL_SECONDS,
             )
         except ValueError:
             logger.warning(
-                f"Invalid SOFA_CACHE_TTL_SECONDS value: {env_val!r}. "
-                f"Using default: {DEFAULT_SOFA_CACHE_TTL_SECONDS}"
+                "Invalid SOFA_CACHE_TTL_SECONDS value: %r. Using default: %d",
+                env_val,
+                DEFAULT_SOFA_CACHE_TTL_SECONDS,
             )
     return DEFAULT_SOFA_CACHE_TTL_SECONDS
 
@@ -175,10 +186,12 @@ def get_model_config(model_key: str) -> ModelConfig:
     Raises:
         KeyError: If model_key is not in the registry
     """
-    if model_key not in MODEL_REGISTRY:
-        available = ", ".join(sorted(MODEL_REGISTRY.keys()))
-        raise KeyError(f"Unknown model key: {model_key!r}. Available: {available}")
-    return MODEL_REGISTRY[model_key]
+    try:
+        return MODEL_REGISTRY[model_key]
+    except KeyError:
+        raise KeyError(
+            f"Unknown model key: {model_key!r}. Available: {_AVAILABLE_MODEL_KEYS}"
+        ) from None
 
 
 def verify_model_cache(model_key: str) -> tuple[bool, list[str]]:
@@ -228,10 +241,13 @@ def verify_model_cache(model_key: str) -> tuple[bool, list[str]]:
                 issues.append(f"HuggingFace cache structure not found: {hf_model_dir}")
             return False, issues
 
-        # Check expected files within the snapshot
+        # Check expected files within the snapshot with one directory read.
+        # Snapshot files are symlinks into blobs/; is_file() follows them, so
+        # a dangling link from an interrupted download counts as missing.
+        with os.scandir(snapshot_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
         for expected_file in config.expected_files:
-            file_path = snapshot_dir / expected_file
-            if not file_path.exists():
+            if expected_file not in present:
                 issues.append(f"Expected file missing: {expected_file}")
 
     else:
@@ -255,21 +271,31 @@ def verify_model_cache(model_key: str) -> tuple[bool, list[str]]:
 def log_registry_status() -> None:
     """Log the status of all registered models.
 
-    Useful for diagnostics and startup logging.
+    Useful for diagnostics and startup logging. Caches are verified
+    concurrently, since each check is blocking filesystem I/O (slow on
+    network-mounted caches); results are logged in registry order.
     """
     logger.info("ML Model Registry Status:")
     logger.info("-" * 60)
 
-    for key, config in MODEL_REGISTRY.items():
-        is_valid, issues = verify_model_cache(key)
+    with ThreadPoolExecutor(max_workers=min(8, len(MODEL_REGISTRY))) as executor:
+        verifications = list(executor.map(verify_model_cache, MODEL_REGISTRY))
+
+    for (key, config), (is_valid, issues) in zip(
+        MODEL_REGISTRY.items(), verifications, strict=True
+    ):
         status = "OK" if is_valid else "MISSING/INVALID"
         rev_str = config.revision[:12] if config.revision else "n/a"
 
         logger.info(
-            f"  [{status:>15}] {key}: {config.model_id} "
-            f"(rev: {rev_str}, ~{config.memory_mb}MB)"
+            "  [%15s] %s: %s (rev: %s, ~%dMB)",
+            status,
+            key,
+            config.model_id,
+            rev_str,
+            config.memory_mb,
         )
         for issue in issues:
-            logger.warning(f"    - {issue}")
+            logger.warning("    - %s", issue)
 
     logger.info("-" * 60)
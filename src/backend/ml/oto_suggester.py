@@ -1,10 +1,12 @@
 """Auto-oto suggestion using ML phoneme detection results."""
 
+import asyncio
 import logging
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-import librosa
-import numpy as np
+import soundfile as sf
 
 from src.backend.domain.alignment_config import AlignmentConfig, AlignmentParams
 from src.backend.domain.oto_suggestion import OtoSuggestion
@@ -124,6 +126,26 @@ IPA_VOWELS = frozenset(
     ]
 )
 
+# Romanized/heuristic phonemes outside the IPA sets.
+# Vowel letters and any run of them in "aeiou" order (ae, ou, ...), including
+# the empty base left by a bare length mark, plus Japanese doubled vowels.
+_VOWEL_LIKE = frozenset(
+    {"aeiou"[i:j] for i in range(6) for j in range(i, 6)}
+    | {"aa", "ii", "uu", "ee", "oo"}
+)
+# Single consonant letters and common Japanese consonant clusters
+_CONSONANT_LIKE = frozenset(
+    set("bcdfghjklmnpqrstvwxyz")
+    | {"sh", "ch", "ts", "dz", "ky", "gy", "ny", "hy", "my", "ry", "py", "by"}
+)
+
+# Length-stripped phoneme -> classification bucket. Consonant entries are
+# written last so they win for phonemes in both groups.
+_PHONEME_CLASSES: dict[str, str] = {
+    **dict.fromkeys(IPA_VOWELS | _VOWEL_LIKE, "vowels"),
+    **dict.fromkeys(IPA_CONSONANTS | _CONSONANT_LIKE, "consonants"),
+}
+
 # Default timing values when detection fails or has low confidence
 DEFAULT_OFFSET_MS = 20.0
 DEFAULT_PREUTTERANCE_MS = 60.0
@@ -213,6 +235,38 @@ CONSONANT_OVERLAP_RATIOS: dict[str, float] = {
 CONSONANT_VOWEL_EXTENSION_RATIO = 0.3
 
 
+@dataclass(frozen=True, slots=True)
+class _SegmentContext:
+    """Main-vowel lookups shared by the oto estimators for one file.
+
+    Attributes:
+        main_vowel: The sustain vowel (see OtoSuggester._find_main_vowel)
+        last_consonant: Latest-ending consonant that ends at or before the
+            main vowel starts, or None if there is none
+    """
+
+    main_vowel: PhonemeSegment
+    last_consonant: PhonemeSegment | None
+
+
+@lru_cache(maxsize=4096)
+def _alias_from_filename(filename: str) -> str:
+    """Generate a default alias from a filename, cached for repeated runs."""
+    # Remove extension
+    name = Path(filename).stem
+
+    # Remove leading underscore if present
+    if name.startswith("_"):
+        name = name[1:]
+
+    # Common pattern: add '- ' prefix for CV samples
+    # This is a simple heuristic, user can override
+    if len(name) <= 3 and name.isalpha():
+        return f"- {name}"
+
+    return name
+
+
 class OtoSuggester:
     """Suggests oto parameters from phoneme detection results.
 
@@ -345,8 +399,7 @@ class OtoSuggester:
                 )
                 fallback_reasons.append(reason)
                 logger.warning(
-                    f"{reason} for {filename}. "
-                    "Falling back to MMS_FA forced alignment."
+                    f"{reason} for {filename}. Falling back to MMS_FA forced alignment."
                 )
             except AlignmentError as e:
                 reason = f"SOFA alignment error: {e}"
@@ -380,63 +433,21 @@ class OtoSuggester:
         # Fall back to defaults if all ML methods failed
         if not segments and not audio_duration_ms:
             try:
-                audio_duration_ms = librosa.get_duration(path=str(audio_path)) * 1000
+                # Header-only read, but still blocking I/O; keep it off the loop
+                info = await asyncio.to_thread(sf.info, str(audio_path))
+                audio_duration_ms = info.duration * 1000
             except Exception as e:
                 logger.warning(f"Failed to get audio duration for {filename}: {e}")
                 audio_duration_ms = 1000.0  # Default 1 second
             detection_method = "defaults"
 
-        logger.debug(f"Detection method for {filename}: {detection_method}")
-
-        # Classify phonemes
-        classification = self._classify_phonemes(segments)
-
-        # Calculate confidence based on detection quality
-        expected_count = self._estimate_expected_phoneme_count(filename)
-        confidence = self._calculate_confidence(
-            segments, audio_duration_ms, expected_phoneme_count=expected_count
-        )
-
-        # Estimate parameters using alignment params from config
-        if segments and confidence >= params.min_confidence_threshold:
-            offset = self._estimate_offset(segments, params)
-            consonant_end = self._estimate_consonant_end(
-                segments, classification, params
-            )
-            preutterance = self._estimate_preutterance(segments, classification)
-            cutoff = self._estimate_cutoff(audio_duration_ms, segments, params)
-            consonant_at_preutterance = self._find_preutterance_consonant(
-                classification
-            )
-            overlap = self._estimate_overlap(
-                offset, preutterance, params, consonant_at_preutterance
-            )
-        else:
-            # Use reasonable defaults
-            logger.info(
-                f"Low confidence ({confidence:.2f}) or no segments, using defaults"
-            )
-            offset = DEFAULT_OFFSET_MS
-            preutterance = DEFAULT_PREUTTERANCE_MS
-            consonant_end = DEFAULT_CONSONANT_MS
-            cutoff = -DEFAULT_CUTOFF_PADDING_MS
-            overlap = DEFAULT_OVERLAP_MS
-
-        # Ensure consonant is at least as large as preutterance
-        consonant_end = max(consonant_end, preutterance + 20)
-
-        return OtoSuggestion(
+        return self._build_suggestion_from_alignment(
             filename=filename,
             alias=alias,
-            offset=round(offset, 1),
-            consonant=round(consonant_end, 1),
-            cutoff=round(cutoff, 1),
-            preutterance=round(preutterance, 1),
-            overlap=round(overlap, 1),
-            confidence=round(confidence, 3),
-            phonemes_detected=segments,
-            audio_duration_ms=round(audio_duration_ms, 1),
-            method_used=detection_method,
+            segments=segments,
+            audio_duration_ms=audio_duration_ms,
+            detection_method=detection_method,
+            params=params,
             fallback_reasons=fallback_reasons,
         )
 
@@ -474,6 +485,9 @@ class OtoSuggester:
                 f"audio_paths length ({len(audio_paths)})"
             )
 
+        # Default alignment params, resolved once for the whole batch
+        params = self._get_params()
+
         # Extract transcripts for all files
         path_to_transcript: dict[Path, str] = {}
         for audio_path in audio_paths:
@@ -525,7 +539,7 @@ class OtoSuggester:
                     )
 
                 # Build suggestions from SOFA results
-                resolved_indices: list[int] = []
+                resolved_indices: set[int] = set()
                 for idx in pending_indices:
                     audio_path = audio_paths[idx]
                     if audio_path in sofa_results:
@@ -541,9 +555,10 @@ class OtoSuggester:
                             segments=result.segments,
                             audio_duration_ms=result.audio_duration_ms,
                             detection_method="sofa",
+                            params=params,
                             fallback_reasons=file_fallback_reasons[idx],
                         )
-                        resolved_indices.append(idx)
+                        resolved_indices.add(idx)
                     elif sofa_batch_error:
                         file_fallback_reasons[idx].append(sofa_batch_error)
                     else:
@@ -558,7 +573,6 @@ class OtoSuggester:
 
         # Phase 2: Batch MMS_FA for files that failed SOFA (or if SOFA unavailable)
         if pending_indices and self.use_forced_alignment:
-            params = self._get_params()
             mms_items = [
                 (audio_paths[idx], path_to_transcript[audio_paths[idx]])
                 for idx in pending_indices
@@ -586,7 +600,7 @@ class OtoSuggester:
                     )
 
                 # Build suggestions from MMS_FA results
-                resolved_indices = []
+                resolved_indices = set()
                 for idx in pending_indices:
                     audio_path = audio_paths[idx]
                     if audio_path in mms_results:
@@ -602,9 +616,10 @@ class OtoSuggester:
                             segments=result.segments,
                             audio_duration_ms=result.audio_duration_ms,
                             detection_method="mms_fa",
+                            params=params,
                             fallback_reasons=file_fallback_reasons[idx],
                         )
-                        resolved_indices.append(idx)
+                        resolved_indices.add(idx)
 
                 # Remove resolved indices from pending
                 pending_indices = [
@@ -633,7 +648,7 @@ class OtoSuggester:
     ) -> OtoSuggestion:
         """Build an OtoSuggestion from alignment results.
 
-        Uses the same parameter estimation logic as suggest_oto().
+        Shared parameter estimation for suggest_oto() and batch_suggest_oto().
 
         Args:
             filename: WAV filename
@@ -649,7 +664,7 @@ class OtoSuggester:
         Returns:
             OtoSuggestion with estimated parameters
         """
-        logger.debug(f"Detection method for {filename}: {detection_method}")
+        logger.debug("Detection method for %s: %s", filename, detection_method)
 
         # Use provided params or get default
         if params is None:
@@ -666,14 +681,18 @@ class OtoSuggester:
 
         # Estimate parameters using alignment params from config
         if segments and confidence >= params.min_confidence_threshold:
+            # The main vowel and the consonant before it feed three estimators
+            context = self._segment_context(classification)
             offset = self._estimate_offset(segments, params)
             consonant_end = self._estimate_consonant_end(
-                segments, classification, params
+                segments, classification, params, context
+            )
+            preutterance = self._estimate_preutterance(
+                segments, classification, context
             )
-            preutterance = self._estimate_preutterance(segments, classification)
             cutoff = self._estimate_cutoff(audio_duration_ms, segments, params)
             consonant_at_preutterance = self._find_preutterance_consonant(
-                classification
+                classification, context
             )
             overlap = self._estimate_overlap(
                 offset, preutterance, params, consonant_at_preutterance
@@ -681,7 +700,7 @@ class OtoSuggester:
         else:
             # Use reasonable defaults
             logger.info(
-                f"Low confidence ({confidence:.2f}) or no segments, using defaults"
+                "Low confidence (%.2f) or no segments, using defaults", confidence
             )
             offset = DEFAULT_OFFSET_MS
             preutterance = DEFAULT_PREUTTERANCE_MS
@@ -716,19 +735,7 @@ class OtoSuggester:
         Returns:
             Generated alias (e.g., '- ka')
         """
-        # Remove extension
-        name = Path(filename).stem
-
-        # Remove leading underscore if present
-        if name.startswith("_"):
-            name = name[1:]
-
-        # Common pattern: add '- ' prefix for CV samples
-        # This is a simple heuristic, user can override
-        if len(name) <= 3 and name.isalpha():
-            return f"- {name}"
-
-        return name
+        return _alias_from_filename(filename)
 
     def _classify_phonemes(
         self, segments: list[PhonemeSegment]
@@ -748,72 +755,12 @@ class OtoSuggester:
         }
 
         for segment in segments:
-            phoneme = segment.phoneme.lower().strip()
-
             # Remove length markers for classification
-            phoneme_base = phoneme.rstrip("\u02d0:")
-
-            if phoneme_base in IPA_CONSONANTS or self._is_consonant_like(phoneme_base):
-                result["consonants"].append(segment)
-            elif phoneme_base in IPA_VOWELS or self._is_vowel_like(phoneme_base):
-                result["vowels"].append(segment)
-            else:
-                # Try heuristics for unknown phonemes
-                if self._is_vowel_like(phoneme_base):
-                    result["vowels"].append(segment)
-                elif self._is_consonant_like(phoneme_base):
-                    result["consonants"].append(segment)
-                else:
-                    result["unknown"].append(segment)
+            phoneme_base = segment.phoneme.lower().strip().rstrip("\u02d0:")
+            result[_PHONEME_CLASSES.get(phoneme_base, "unknown")].append(segment)
 
         return result
 
-    def _is_vowel_like(self, phoneme: str) -> bool:
-        """Heuristic check if phoneme is vowel-like.
-
-        Args:
-            phoneme: Phoneme string to check
-
-        Returns:
-            True if likely a vowel
-        """
-        # Single character vowels
-        if phoneme in "aeiou":
-            return True
-
-        # Japanese vowels in various notations
-        return phoneme in {"aa", "ii", "uu", "ee", "oo"}
-
-    def _is_consonant_like(self, phoneme: str) -> bool:
-        """Heuristic check if phoneme is consonant-like.
-
-        Args:
-            phoneme: Phoneme string to check
-
-        Returns:
-            True if likely a consonant
-        """
-        # Common consonant letters not in basic vowel set
-        consonant_letters = set("bcdfghjklmnpqrstvwxyz")
-        if len(phoneme) == 1 and phoneme in consonant_letters:
-            return True
-
-        # Common Japanese consonant clusters
-        return phoneme in {
-            "sh",
-            "ch",
-            "ts",
-            "dz",
-            "ky",
-            "gy",
-            "ny",
-            "hy",
-            "my",
-            "ry",
-            "py",
-            "by",
-        }
-
     def _find_main_vowel(
         self,
         consonants: list[PhonemeSegment],
@@ -868,6 +815,35 @@ class OtoSuggester:
         # Use the first vowel.
         return min(vowels, key=lambda s: s.start_ms)
 
+    def _segment_context(
+        self,
+        classification: dict[str, list[PhonemeSegment]],
+    ) -> _SegmentContext | None:
+        """Find the main vowel and the last consonant before it.
+
+        Args:
+            classification: Phoneme classification result
+
+        Returns:
+            _SegmentContext, or None unless both consonants and vowels
+            were detected
+        """
+        consonants = classification.get("consonants", [])
+        vowels = classification.get("vowels", [])
+        if not consonants or not vowels:
+            return None
+
+        main_vowel = self._find_main_vowel(consonants, vowels)
+        consonants_before_vowel = [
+            c for c in consonants if c.end_ms <= main_vowel.start_ms + 1e-3
+        ]
+        last_consonant = (
+            max(consonants_before_vowel, key=lambda s: s.end_ms)
+            if consonants_before_vowel
+            else None
+        )
+        return _SegmentContext(main_vowel=main_vowel, last_consonant=last_consonant)
+
     def _estimate_offset(
         self,
         segments: list[PhonemeSegment],
@@ -907,6 +883,7 @@ class OtoSuggester:
         segments: list[PhonemeSegment],
         classification: dict[str, list[PhonemeSegment]],
         params: AlignmentParams | None = None,
+        context: _SegmentContext | None = None,
     ) -> float:
         """Find end of consonant/fixed region.
 
@@ -918,6 +895,7 @@ class OtoSuggester:
             classification: Phoneme classification result
             params: Optional alignment params for extension ratio.
                    If not provided, uses module-level defaults.
+            context: Optional precomputed _segment_context(classification)
 
         Returns:
             Estimated consonant end time in milliseconds
@@ -941,16 +919,11 @@ class OtoSuggester:
         # preceding vowel.
         if consonants and vowels:
             # Find the main (sustain) vowel -- handles both CV and VCV
-            main_vowel = self._find_main_vowel(consonants, vowels)
+            context = context or self._segment_context(classification)
+            main_vowel = context.main_vowel
 
             # Consonant region extends to end of consonant + part of vowel
-            last_consonant_before_vowel = None
-            for c in consonants:
-                if c.end_ms <= main_vowel.start_ms + 1e-3 and (
-                    last_consonant_before_vowel is None
-                    or c.end_ms > last_consonant_before_vowel.end_ms
-                ):
-                    last_consonant_before_vowel = c
+            last_consonant_before_vowel = context.last_consonant
 
             if last_consonant_before_vowel:
                 # Extend into vowel by ratio
@@ -979,6 +952,7 @@ class OtoSuggester:
         self,
         segments: list[PhonemeSegment],
         classification: dict[str, list[PhonemeSegment]],
+        context: _SegmentContext | None = None,
     ) -> float:
         """Estimate preutterance position (absolute position from audio start).
 
@@ -988,6 +962,7 @@ class OtoSuggester:
         Args:
             segments: List of detected phoneme segments
             classification: Phoneme classification result
+            context: Optional precomputed _segment_context(classification)
 
         Returns:
             Estimated preutterance position in milliseconds (from audio start)
@@ -1002,21 +977,15 @@ class OtoSuggester:
         # For VCV samples, use the boundary before the sustain vowel (after
         # the consonant), not the preceding vowel.
         if consonants and vowels:
-            # Find the main (sustain) vowel -- handles both CV and VCV
-            main_vowel = self._find_main_vowel(consonants, vowels)
-
-            # Find last consonant before the main vowel
-            consonants_before_vowel = [
-                c for c in consonants if c.end_ms <= main_vowel.start_ms + 1e-3
-            ]
+            # Find the main (sustain) vowel and the last consonant before it
+            context = context or self._segment_context(classification)
 
-            if consonants_before_vowel:
+            if context.last_consonant is not None:
                 # Preutterance is at the end of the last consonant (C->V boundary)
-                last_consonant = max(consonants_before_vowel, key=lambda s: s.end_ms)
-                return last_consonant.end_ms
+                return context.last_consonant.end_ms
 
             # No consonant before main vowel - preutterance at vowel start
-            return main_vowel.start_ms
+            return context.main_vowel.start_ms
 
         elif consonants:
             # Only consonants - preutterance at end of last consonant
@@ -1066,6 +1035,7 @@ class OtoSuggester:
     def _find_preutterance_consonant(
         self,
         classification: dict[str, list[PhonemeSegment]],
+        context: _SegmentContext | None = None,
     ) -> str | None:
         """Find the consonant phoneme closest to the preutterance point.
 
@@ -1076,6 +1046,7 @@ class OtoSuggester:
         Args:
             classification: Phoneme classification with 'consonants' and
                 'vowels' keys.
+            context: Optional precomputed _segment_context(classification)
 
         Returns:
             Base phoneme string of the consonant at preutterance, or None
@@ -1088,13 +1059,11 @@ class OtoSuggester:
             return None
 
         if consonants and vowels:
-            main_vowel = self._find_main_vowel(consonants, vowels)
-            consonants_before_vowel = [
-                c for c in consonants if c.end_ms <= main_vowel.start_ms + 1e-3
-            ]
-            if consonants_before_vowel:
-                last_consonant = max(consonants_before_vowel, key=lambda s: s.end_ms)
-                return self._strip_ipa_modifiers(last_consonant.phoneme.lower().strip())
+            context = context or self._segment_context(classification)
+            if context.last_consonant is not None:
+                return self._strip_ipa_modifiers(
+                    context.last_consonant.phoneme.lower().strip()
+                )
 
         # Fallback: use the last consonant overall
         last_consonant = max(consonants, key=lambda s: s.end_ms)
@@ -1311,7 +1280,7 @@ class OtoSuggester:
 
         # Factor 3: Raw detection confidence (minor factor)
         # This is often low for sustained vowels, so we weight it less.
-        avg_raw_confidence = float(np.mean([s.confidence for s in segments]))
+        avg_raw_confidence = sum(s.confidence for s in segments) / len(segments)
         # Normalize: FA confidence of 0.3+ is considered good
         raw_score = min(1.0, avg_raw_confidence / 0.3)
 
@@ -0,0 +1,94 @@
+"""Tests for RMS energy analysis used by forced alignment.
+
+Covers the hysteresis region detection that keeps sustained vowels from
+being split at brief energy dips, the merging of regions separated by short
+gaps, and the energy-based vowel end search.
+"""
+
+import numpy as np
+
+from src.backend.ml.forced_alignment_detector import (
+    ENERGY_END_PADDING_MS,
+    EnergyProfile,
+    _find_sound_regions_with_hysteresis,
+    _merge_adjacent_regions,
+    find_energy_end_in_region,
+)
+
+
+class TestFindSoundRegionsWithHysteresis:
+    """Test the hysteresis state machine over RMS frames."""
+
+    def test_single_region(self) -> None:
+        """Test a single burst of energy produces one region."""
+        rms = np.array([0.0, 0.5, 0.6, 0.5, 0.0], dtype=np.float32)
+        times = np.arange(len(rms)) * 16.0
+        regions = _find_sound_regions_with_hysteresis(rms, times, 0.3, 0.1)
+        assert regions == [(16.0, 64.0)]
+
+    def test_dip_between_thresholds_does_not_split(self) -> None:
+        """Test a dip that stays above the off threshold keeps the region on."""
+        rms = np.array([0.0, 0.5, 0.2, 0.5, 0.0], dtype=np.float32)
+        times = np.arange(len(rms)) * 16.0
+        regions = _find_sound_regions_with_hysteresis(rms, times, 0.3, 0.1)
+        assert regions == [(16.0, 64.0)]
+
+    def test_region_open_at_end_is_closed(self) -> None:
+        """Test a region still on at the last frame ends there."""
+        rms = np.array([0.0, 0.0, 0.5, 0.5], dtype=np.float32)
+        times = np.arange(len(rms)) * 16.0
+        regions = _find_sound_regions_with_hysteresis(rms, times, 0.3, 0.1)
+        assert regions == [(32.0, 48.0)]
+
+    def test_empty_input(self) -> None:
+        """Test empty RMS produces no regions."""
+        rms = np.array([], dtype=np.float32)
+        assert _find_sound_regions_with_hysteresis(rms, rms, 0.3, 0.1) == []
+
+
+class TestMergeAdjacentRegions:
+    """Test merging of sound regions separated by short gaps."""
+
+    def test_short_gaps_merged(self) -> None:
+        """Test only gaps of at least min_gap_ms are kept as silence."""
+        regions = [(0.0, 10.0), (15.0, 20.0), (120.0, 130.0), (140.0, 150.0)]
+        assert _merge_adjacent_regions(regions, 80.0) == [(0.0, 20.0), (120.0, 150.0)]
+
+    def test_gap_at_threshold_kept(self) -> None:
+        """Test a gap exactly min_gap_ms long separates regions."""
+        regions = [(0.0, 10.0), (90.0, 100.0)]
+        assert _merge_adjacent_regions(regions, 80.0) == regions
+
+
+class TestFindEnergyEndInRegion:
+    """Test the energy end search within a single region."""
+
+    @staticmethod
+    def _profile(rms: list[float]) -> EnergyProfile:
+        return EnergyProfile(
+            rms=np.array(rms, dtype=np.float32),
+            times_ms=np.arange(len(rms), dtype=np.float32) * np.float32(16.0),
+            release_threshold=0.3,
+        )
+
+    def test_energy_drop_is_padded(self) -> None:
+        """Test the first below-threshold frame plus padding is returned."""
+        profile = self._profile([0.5, 0.5, 0.1, 0.5])
+        assert find_energy_end_in_region(profile, 0.0, 48.0) == (
+            32.0 + ENERGY_END_PADDING_MS
+        )
+
+    def test_sustained_energy_returns_region_end(self) -> None:
+        """Test energy above threshold throughout extends to the region end."""
+        profile = self._profile([0.5, 0.5, 0.5, 0.5])
+        assert find_energy_end_in_region(profile, 0.0, 40.0) == 40.0
+
+    def test_silent_region_start_returns_none(self) -> None:
+        """Test no extension when energy is already below threshold."""
+        profile = self._profile([0.1, 0.5, 0.5])
+        assert find_energy_end_in_region(profile, 0.0, 32.0) is None
+
+    def test_empty_region_returns_none(self) -> None:
+        """Test a region containing no frames gives no extension."""
+        profile = self._profile([0.5, 0.5])
+        assert find_energy_end_in_region(profile, 40.0, 30.0) is None
@@ -0,0 +1,302 @@
+"""Tests for batched MMS_FA alignment: emission computation, length
+bucketing and reuse of preprocessed audio across batch runs.
+
+Uses a tiny randomly initialized Wav2Vec2 model wrapped the same way as the
+MMS_FA bundle, so no pretrained weights are downloaded.
+"""
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf
+import torch
+import torchaudio
+from torchaudio.models import wav2vec2_model
+from torchaudio.pipelines._wav2vec2.utils import _extend_model
+
+from src.backend.ml import forced_alignment_detector as fad
+from src.backend.ml.forced_alignment_detector import (
+    ENERGY_ONLY_MAX_CONFIDENCE,
+    ENERGY_ONLY_MODEL_NAME,
+    ForcedAlignmentDetector,
+    _batched_emissions,
+    _length_buckets,
+)
+
+
+@pytest.fixture
+def tiny_mms_fa_model() -> torch.nn.Module:
+    """Small Wav2Vec2 model with the MMS_FA input/output wrapping."""
+    torch.manual_seed(0)
+    model = wav2vec2_model(
+        extractor_mode="layer_norm",
+        extractor_conv_layer_config=[(16, 10, 5), (16, 3, 2), (16, 2, 2)],
+        extractor_conv_bias=True,
+        encoder_embed_dim=32,
+        encoder_projection_dropout=0.0,
+        encoder_pos_conv_kernel=16,
+        encoder_pos_conv_groups=4,
+        encoder_num_layers=2,
+        encoder_num_heads=4,
+        encoder_attention_dropout=0.0,
+        encoder_ff_interm_features=64,
+        encoder_ff_interm_dropout=0.0,
+        encoder_dropout=0.0,
+        encoder_layer_norm_first=True,
+        encoder_layer_drop=0.0,
+        aux_num_out=28,
+    )
+    wrapped = _extend_model(
+        model, normalize_waveform=True, apply_log_softmax=True, append_star=False
+    )
+    return wrapped.eval()
+
+
+class TestBatchedEmissions:
+    """Test that batching waveforms does not change their emissions."""
+
+    def test_matches_unbatched_forward(self, tiny_mms_fa_model) -> None:
+        """Test each batched emission equals a single-waveform forward pass."""
+        waveforms = [0.1 * torch.randn(1, n) for n in (1600, 4000, 2500)]
+
+        emissions, emission_lengths = _batched_emissions(
+            tiny_mms_fa_model, waveforms, torch.device("cpu")
+        )
+
+        assert emissions.size(0) == len(waveforms)
+        for i, waveform in enumerate(waveforms):
+            with torch.inference_mode():
+                expected, _ = tiny_mms_fa_model(waveform)
+            emission = emissions[i : i + 1, : emission_lengths[i]]
+            assert emission.shape == expected.shape
+            assert torch.allclose(emission, expected, atol=1e-4)
+
+
+class TestLengthBuckets:
+    """Test grouping of files into similar-length batches."""
+
+    def test_sorted_and_capped_at_batch_size(self) -> None:
+        """Test indices are sorted by length and split by batch size."""
+        lengths = [500, 100, 400, 200, 300]
+        assert _length_buckets(lengths, 2, 10.0) == [[1, 3], [4, 2], [0]]
+
+    def test_length_ratio_splits_bucket(self) -> None:
+        """Test a much longer item starts a new bucket before it is full."""
+        lengths = [100, 250, 301, 900]
+        assert _length_buckets(lengths, 8, 3.0) == [[0, 1], [2, 3]]
+
+    def test_every_index_assigned_once(self) -> None:
+        """Test buckets partition the input indices."""
+        lengths = [7, 3, 3, 50, 1, 12, 9]
+        buckets = _length_buckets(lengths, 3, 3.0)
+        assert sorted(i for bucket in buckets for i in bucket) == list(range(7))
+        assert all(len(bucket) <= 3 for bucket in buckets)
+
+    def test_empty_input(self) -> None:
+        """Test no lengths produce no buckets."""
+        assert _length_buckets([], 8, 3.0) == []
+
+
+class TestPreprocessedAudioCache:
+    """Test reuse of preprocessed audio between alignment runs."""
+
+    def test_unchanged_file_is_reused(self, tmp_path) -> None:
+        """Test loading the same unmodified file twice returns cached arrays."""
+        path = tmp_path / "ka.wav"
+        sf.write(path, np.zeros(1600, dtype=np.float32), 16000)
+        detector = ForcedAlignmentDetector()
+
+        first = detector._load_audio(path)
+        second = detector._load_audio(path)
+
+        assert second is first
+
+    def test_modified_file_is_reloaded(self, tmp_path) -> None:
+        """Test a file rewritten since the last load is preprocessed again."""
+        path = tmp_path / "ka.wav"
+        sf.write(path, np.zeros(1600, dtype=np.float32), 16000)
+        detector = ForcedAlignmentDetector()
+        first = detector._load_audio(path)
+
+        sf.write(path, np.full(3200, 0.5, dtype=np.float32), 16000)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        second = detector._load_audio(path)
+
+        assert second is not first
+        assert second[0].size(1) == 3200
+
+
+class TestBatchDetectPhonemes:
+    """Test batched detection against single-file detection."""
+
+    @pytest.mark.asyncio
+    async def test_matches_single_file_detection(
+        self, tiny_mms_fa_model, tmp_path
+    ) -> None:
+        """Test bucketed batch results equal per-file results, in input order."""
+        rng = np.random.default_rng(0)
+        items = []
+        for i, num_samples in enumerate((8000, 24000, 9000, 30000, 12000)):
+            path = tmp_path / f"s{i}.wav"
+            audio = np.zeros(num_samples, dtype=np.float32)
+            audio[num_samples // 4 : -num_samples // 4] = 0.3 * rng.standard_normal(
+                num_samples - 2 * (num_samples // 4)
+            )
+            sf.write(path, audio, 16000)
+            items.append((path, "a ka"))
+
+        detector = ForcedAlignmentDetector()
+        detector._model = tiny_mms_fa_model
+        detector._dictionary = torchaudio.pipelines.MMS_FA.get_dict(star=None)
+
+        expected = {
+            path: await detector.detect_phonemes_with_transcript(path, transcript)
+            for path, transcript in items
+        }
+        results = await detector.batch_detect_phonemes(items, batch_size=2)
+
+        assert list(results) == [path for path, _ in items]
+        for path, result in results.items():
+            assert [s.phoneme for s in result.segments] == [
+                s.phoneme for s in expected[path].segments
+            ]
+            for actual, single in zip(
+                result.segments, expected[path].segments, strict=True
+            ):
+                assert actual.start_ms == pytest.approx(single.start_ms, abs=1e-3)
+                assert actual.end_ms == pytest.approx(single.end_ms, abs=1e-3)
+
+    @pytest.mark.asyncio
+    async def test_loads_one_chunk_at_a_time(self, tmp_path, monkeypatch) -> None:
+        """Test each chunk is aligned before the next chunk's audio is loaded."""
+        monkeypatch.setattr(fad, "ALIGNMENT_BATCHES_PER_CHUNK", 2)
+        items = []
+        for i in range(5):
+            path = tmp_path / f"a{i}.wav"
+            sf.write(path, np.full(1600, 0.3, dtype=np.float32), 16000)
+            items.append((path, "a"))
+
+        detector = ForcedAlignmentDetector()
+        detector._model = torch.nn.Module()
+        detector._dictionary = torchaudio.pipelines.MMS_FA.get_dict(star=None)
+
+        prepared: list[Path] = []
+        loaded_at_alignment: list[int] = []
+        prepare = detector._prepare_alignment_input
+        align_buckets = detector._align_buckets
+
+        def _prepare(audio_path, *args):
+            prepared.append(audio_path)
+            return prepare(audio_path, *args)
+
+        def _align(*args):
+            loaded_at_alignment.append(len(prepared))
+            return align_buckets(*args)
+
+        monkeypatch.setattr(detector, "_prepare_alignment_input", _prepare)
+        monkeypatch.setattr(detector, "_align_buckets", _align)
+
+        results = await detector.batch_detect_phonemes(items, batch_size=1)
+
+        assert list(results) == [path for path, _ in items]
+        assert loaded_at_alignment == [2, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_waiting_for_inference_lock_keeps_loop_running(
+        self, tiny_mms_fa_model, tmp_path
+    ) -> None:
+        """Test single-file detection waits for the lock off the event loop."""
+        path = tmp_path / "ka.wav"
+        sf.write(path, 0.3 * np.sin(np.arange(8000) * 0.2), 16000)
+
+        detector = ForcedAlignmentDetector()
+        detector._model = tiny_mms_fa_model
+        detector._dictionary = torchaudio.pipelines.MMS_FA.get_dict(star=None)
+
+        # Held as a concurrent batch alignment would, released from a thread
+        detector._inference_lock.acquire()
+        threading.Timer(0.5, detector._inference_lock.release).start()
+
+        task = asyncio.create_task(detector.detect_phonemes_with_transcript(path, "ka"))
+        ticks = 0
+        while not task.done():
+            await asyncio.sleep(0.05)
+            ticks += 1
+
+        assert [s.phoneme for s in task.result().segments] == ["k", "a"]
+        assert ticks >= 5
+
+    def test_follows_model_moved_after_load(self, monkeypatch) -> None:
+        """Test each forward pass runs on the shared model's current device."""
+        model = torch.nn.Linear(1, 1)
+        detector = ForcedAlignmentDetector()
+        detector._model = model
+        detector._dictionary = torchaudio.pipelines.MMS_FA.get_dict(star=None)
+
+        devices: list[torch.device] = []
+
+        def _record(_model, _waveforms, device):
+            devices.append(device)
+            return torch.zeros(1, 1, 1), torch.ones(1, dtype=torch.int32)
+
+        monkeypatch.setattr(fad, "_batched_emissions", _record)
+
+        detector._launch_batch(model, [])
+        # As another detector's CPU fallback would move the shared singleton
+        model.to("meta")
+        detector._launch_batch(model, [])
+
+        assert devices == [torch.device("cpu"), torch.device("meta")]
+
+
+class TestSinglePhonemeFastPath:
+    """Test single-phoneme transcripts are placed from energy alone."""
+
+    @pytest.mark.asyncio
+    async def test_skips_forced_alignment(self, tmp_path) -> None:
+        """Test a one-token transcript spans the sound without the model."""
+        path = tmp_path / "_a.wav"
+        audio = np.zeros(16000, dtype=np.float32)
+        audio[4000:12000] = 0.3 * np.sin(np.arange(8000) * 0.2)
+        sf.write(path, audio, 16000)
+
+        detector = ForcedAlignmentDetector()
+        detector._model = torch.nn.Module()  # Fails if the forward pass runs
+        detector._dictionary = torchaudio.pipelines.MMS_FA.get_dict(star=None)
+
+        result = await detector.detect_phonemes_with_transcript(path, "a")
+        batch = await detector.batch_detect_phonemes([(path, "a")])
+
+        assert result.model_name == ENERGY_ONLY_MODEL_NAME
+        assert [s.phoneme for s in result.segments] == ["a"]
+        segment = result.segments[0]
+        assert 150.0 < segment.start_ms < 250.0
+        assert 750.0 < segment.end_ms < 850.0
+        assert 0.0 < segment.confidence <= ENERGY_ONLY_MAX_CONFIDENCE
+        assert batch[path] == result
+
+    @pytest.mark.asyncio
+    async def test_confidence_follows_energy_margin(self, tmp_path) -> None:
+        """Test a sound barely above its noise floor scores lower."""
+        rng = np.random.default_rng(0)
+        tone = 0.3 * np.sin(np.arange(8000) * 0.2)
+        detector = ForcedAlignmentDetector()
+        detector._model = torch.nn.Module()
+        detector._dictionary = torchaudio.pipelines.MMS_FA.get_dict(star=None)
+
+        confidences = []
+        for name, noise in (("clean", 0.001), ("noisy", 0.2)):
+            path = tmp_path / f"{name}.wav"
+            audio = (noise * rng.standard_normal(16000)).astype(np.float32)
+            audio[4000:12000] += tone
+            sf.write(path, audio, 16000)
+            result = await detector.detect_phonemes_with_transcript(path, "a")
+            confidences.append(result.segments[0].confidence)
+
+        clean, noisy = confidences
+        assert noisy < clean
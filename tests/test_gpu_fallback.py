@@ -0,0 +1,112 @@
+"""Tests for GPU OOM handling in ML inference.
+
+Simulates CUDA out-of-memory errors with plain RuntimeErrors so the retry
+and CPU fallback paths run without a GPU.
+"""
+
+import pytest
+import torch
+
+from src.backend.ml.gpu_fallback import is_cuda_oom, run_inference_with_cpu_fallback
+
+OOM_MESSAGE = "CUDA out of memory. Tried to allocate 20.00 MiB"
+
+
+class TestIsCudaOom:
+    """Test recognition of CUDA out-of-memory errors."""
+
+    def test_out_of_memory_message(self) -> None:
+        """Test the standard OOM message is recognized."""
+        assert is_cuda_oom(RuntimeError(OOM_MESSAGE))
+
+    def test_cuda_alloc_in_either_order(self) -> None:
+        """Test allocation failures mentioning CUDA are recognized."""
+        assert is_cuda_oom(RuntimeError("CUDA error: failed to allocate"))
+        assert is_cuda_oom(RuntimeError("cuDNN alloc failed on cuda device"))
+
+    def test_unrelated_error(self) -> None:
+        """Test other runtime errors are not treated as OOM."""
+        assert not is_cuda_oom(RuntimeError("shape mismatch"))
+
+
+class TestRunInferenceWithCpuFallback:
+    """Test the GPU retry and CPU fallback sequence."""
+
+    def test_retries_on_gpu_before_cpu(self) -> None:
+        """Test a single OOM is retried on the GPU without the CPU fallback."""
+        calls: list[str] = []
+
+        def gpu() -> str:
+            calls.append("gpu")
+            if len(calls) == 1:
+                raise RuntimeError(OOM_MESSAGE)
+            return "gpu"
+
+        def cpu(_tensors: dict[str, torch.Tensor]) -> str:
+            calls.append("cpu")
+            return "cpu"
+
+        result = run_inference_with_cpu_fallback(
+            model=torch.nn.Linear(2, 2), inference_fn=gpu, cpu_inference_fn=cpu
+        )
+
+        assert result == "gpu"
+        assert calls == ["gpu", "gpu"]
+
+    def test_falls_back_to_cpu_after_second_oom(self) -> None:
+        """Test repeated OOMs move the inputs to CPU and run the CPU path."""
+        calls: list[str] = []
+
+        def gpu() -> str:
+            calls.append("gpu")
+            raise RuntimeError(OOM_MESSAGE)
+
+        def cpu(tensors: dict[str, torch.Tensor]) -> str:
+            calls.append("cpu")
+            assert tensors["x"].device.type == "cpu"
+            return "cpu"
+
+        result = run_inference_with_cpu_fallback(
+            model=torch.nn.Linear(2, 2),
+            inference_fn=gpu,
+            tensors_to_move={"x": torch.zeros(2)},
+            cpu_inference_fn=cpu,
+        )
+
+        assert result == "cpu"
+        assert calls == ["gpu", "gpu", "cpu"]
+
+    def test_non_oom_error_propagates(self) -> None:
+        """Test errors other than OOM are raised without retrying."""
+        calls: list[str] = []
+
+        def gpu() -> str:
+            calls.append("gpu")
+            raise RuntimeError("shape mismatch")
+
+        with pytest.raises(RuntimeError, match="shape mismatch"):
+            run_inference_with_cpu_fallback(
+                model=torch.nn.Linear(2, 2), inference_fn=gpu
+            )
+        assert calls == ["gpu"]
+
+    def test_cpu_quantize_swaps_linear_layers(self) -> None:
+        """Test cpu_quantize leaves the model int8-quantized for the CPU run."""
+        model = torch.nn.Sequential(torch.nn.Linear(4, 4))
+
+        def gpu() -> torch.Tensor:
+            raise RuntimeError(OOM_MESSAGE)
+
+        def cpu(tensors: dict[str, torch.Tensor]) -> torch.Tensor:
+            return model(tensors["x"])
+
+        result = run_inference_with_cpu_fallback(
+            model=model,
+            inference_fn=gpu,
+            tensors_to_move={"x": torch.ones(1, 4)},
+            cpu_inference_fn=cpu,
+            cpu_quantize=True,
+        )
+
+        assert result.shape == (1, 4)
+        assert isinstance(model[0], torch.ao.nn.quantized.dynamic.Linear)
@@ -4,10 +4,15 @@ import logging
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
+import soundfile as sf
+import torch
+import torchaudio
 
 from src.backend.domain.oto_suggestion import OtoSuggestion, OtoSuggestionRequest
 from src.backend.domain.phoneme import PhonemeDetectionResult, PhonemeSegment
+from src.backend.ml.forced_alignment_detector import ForcedAlignmentDetector
 from src.backend.ml.oto_suggester import (
     DEFAULT_CONSONANT_MS,
     DEFAULT_CUTOFF_PADDING_MS,
@@ -522,8 +527,8 @@ class TestSuggestOto:
             "Failed to process audio"
         )
 
-        with patch("src.backend.ml.oto_suggester.librosa") as mock_librosa:
-            mock_librosa.get_duration.return_value = 0.3  # 300ms
+        with patch("src.backend.ml.oto_suggester.sf") as mock_sf:
+            mock_sf.info.return_value.duration = 0.3  # 300ms
             suggestion = await suggester.suggest_oto(Path("/fake/path/_ka.wav"))
 
         # Should use defaults
@@ -531,6 +536,33 @@ class TestSuggestOto:
         assert suggestion.preutterance == DEFAULT_PREUTTERANCE_MS
         assert suggestion.confidence == 0.0
 
+    @pytest.mark.asyncio
+    async def test_energy_only_vowel_scores_below_aligned(
+        self, suggester: OtoSuggester, mock_fa_detector: MagicMock, tmp_path
+    ) -> None:
+        """Test a single vowel placed from energy alone is less confident."""
+        path = tmp_path / "_a.wav"
+        audio = np.zeros(16000, dtype=np.float32)
+        audio[4000:12000] = 0.3 * np.sin(np.arange(8000) * 0.2)
+        sf.write(path, audio, 16000)
+
+        detector = ForcedAlignmentDetector()
+        detector._model = torch.nn.Module()  # Fails if the forward pass runs
+        detector._dictionary = torchaudio.pipelines.MMS_FA.get_dict(star=None)
+        energy_suggester = OtoSuggester(use_forced_alignment=True, use_sofa=False)
+        energy_suggester._forced_alignment_detector = detector
+        energy_only = await energy_suggester.suggest_oto(path)
+
+        segment = energy_only.phonemes_detected[0]
+        mock_fa_detector.detect_phonemes.return_value = PhonemeDetectionResult(
+            segments=[segment.model_copy(update={"confidence": 0.8})],
+            audio_duration_ms=energy_only.audio_duration_ms,
+            model_name="torchaudio-mms-fa",
+        )
+        aligned = await suggester.suggest_oto(path)
+
+        assert energy_only.confidence < aligned.confidence
+
 
 class TestIPASets:
     """Test IPA phoneme sets coverage."""
@@ -1162,9 +1194,9 @@ class TestSuggestOtoFallbackChain:
 
         with (
             patch("src.backend.ml.oto_suggester.is_sofa_available", return_value=False),
-            patch("src.backend.ml.oto_suggester.librosa") as mock_librosa,
+            patch("src.backend.ml.oto_suggester.sf") as mock_sf,
         ):
-            mock_librosa.get_duration.return_value = 0.3  # 300ms
+            mock_sf.info.return_value.duration = 0.3  # 300ms
             suggestion = await suggester_full_chain.suggest_oto(
                 Path("/fake/_ka.wav"), alias="- ka"
             )
@@ -1195,9 +1227,9 @@ class TestSuggestOtoFallbackChain:
 
         with (
             patch("src.backend.ml.oto_suggester.is_sofa_available", return_value=False),
-            patch("src.backend.ml.oto_suggester.librosa") as mock_librosa,
+            patch("src.backend.ml.oto_suggester.sf") as mock_sf,
         ):
-            mock_librosa.get_duration.return_value = 0.5  # 500ms
+            mock_sf.info.return_value.duration = 0.5  # 500ms
             suggestion = await suggester_full_chain.suggest_oto(
                 Path("/fake/_weird.wav"), alias="- weird"
             )
@@ -1229,9 +1261,9 @@ class TestSuggestOtoFallbackChain:
 
         with (
             patch("src.backend.ml.oto_suggester.is_sofa_available", return_value=True),
-            patch("src.backend.ml.oto_suggester.librosa") as mock_librosa,
+            patch("src.backend.ml.oto_suggester.sf") as mock_sf,
         ):
-            mock_librosa.get_duration.return_value = 0.4  # 400ms
+            mock_sf.info.return_value.duration = 0.4  # 400ms
             suggestion = await suggester_full_chain.suggest_oto(
                 Path("/fake/_ka.wav"), alias="- ka"
             )
@@ -1254,13 +1286,13 @@ class TestSuggestOtoFallbackChain:
         assert "MMS_FA forced alignment failed" in suggestion.fallback_reasons[1]
 
     @pytest.mark.asyncio
-    async def test_full_cascade_all_fail_librosa_also_fails(
+    async def test_full_cascade_all_fail_duration_read_also_fails(
         self,
         suggester_full_chain: OtoSuggester,
         mock_sofa_aligner: MagicMock,
         mock_fa_detector: MagicMock,
     ) -> None:
-        """When everything fails including librosa, duration defaults to 1000ms."""
+        """When everything fails including the duration read, it defaults to 1000ms."""
         from src.backend.ml.forced_alignment_detector import ForcedAlignmentError
         from src.backend.ml.sofa_aligner import AlignmentError
 
@@ -1271,9 +1303,9 @@ class TestSuggestOtoFallbackChain:
 
         with (
             patch("src.backend.ml.oto_suggester.is_sofa_available", return_value=True),
-            patch("src.backend.ml.oto_suggester.librosa") as mock_librosa,
+            patch("src.backend.ml.oto_suggester.sf") as mock_sf,
         ):
-            mock_librosa.get_duration.side_effect = RuntimeError("File not found")
+            mock_sf.info.side_effect = RuntimeError("File not found")
             suggestion = await suggester_full_chain.suggest_oto(
                 Path("/fake/_ka.wav"), alias="- ka"
             )
@@ -1348,9 +1380,9 @@ class TestSuggestOtoFallbackChain:
 
         with (
             patch("src.backend.ml.oto_suggester.is_sofa_available", return_value=True),
-            patch("src.backend.ml.oto_suggester.librosa") as mock_librosa,
+            patch("src.backend.ml.oto_suggester.sf") as mock_sf,
         ):
-            mock_librosa.get_duration.return_value = 0.3
+            mock_sf.info.return_value.duration = 0.3
             suggestion = await suggester.suggest_oto(
                 Path("/fake/_ka.wav"), alias="- ka"
             )
@@ -1405,7 +1437,7 @@ class TestSuggestOtoFallbackLogging:
     SOFA AlignmentError -> warning
     MMS_FA ForcedAlignmentError -> warning
     MMS_FA TranscriptExtractionError -> warning
-    librosa failure -> warning
+    duration read failure -> warning
     """
 
     @pytest.fixture
@@ -1513,10 +1545,10 @@ class TestSuggestOtoFallbackLogging:
 
         with (
             patch("src.backend.ml.oto_suggester.is_sofa_available", return_value=False),
-            patch("src.backend.ml.oto_suggester.librosa") as mock_librosa,
+            patch("src.backend.ml.oto_suggester.sf") as mock_sf,
             caplog.at_level(logging.DEBUG, logger="src.backend.ml.oto_suggester"),
         ):
-            mock_librosa.get_duration.return_value = 0.3
+            mock_sf.info.return_value.duration = 0.3
             await suggester.suggest_oto(Path("/fake/_ka.wav"), alias="- ka")
 
         warn_records = [
@@ -1526,14 +1558,14 @@ class TestSuggestOtoFallbackLogging:
         assert warn_records[0].levelno == logging.WARNING
 
     @pytest.mark.asyncio
-    async def test_librosa_failure_logged_at_warning(
+    async def test_duration_read_failure_logged_at_warning(
         self,
         suggester: OtoSuggester,
         mock_sofa_aligner: MagicMock,
         mock_fa_detector: MagicMock,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
-        """When librosa.get_duration fails, a WARNING is logged."""
+        """When soundfile.info fails, a WARNING is logged."""
         from src.backend.ml.forced_alignment_detector import ForcedAlignmentError
         from src.backend.ml.sofa_aligner import AlignmentError
 
@@ -1544,10 +1576,10 @@ class TestSuggestOtoFallbackLogging:
 
         with (
             patch("src.backend.ml.oto_suggester.is_sofa_available", return_value=True),
-            patch("src.backend.ml.oto_suggester.librosa") as mock_librosa,
+            patch("src.backend.ml.oto_suggester.sf") as mock_sf,
             caplog.at_level(logging.DEBUG, logger="src.backend.ml.oto_suggester"),
         ):
-            mock_librosa.get_duration.side_effect = RuntimeError("File not found")
+            mock_sf.info.side_effect = RuntimeError("File not found")
             await suggester.suggest_oto(Path("/fake/_ka.wav"), alias="- ka")
 
         warn_records = [
@@ -1575,10 +1607,10 @@ class TestSuggestOtoFallbackLogging:
 
         with (
             patch("src.backend.ml.oto_suggester.is_sofa_available", return_value=True),
-            patch("src.backend.ml.oto_suggester.librosa") as mock_librosa,
+            patch("src.backend.ml.oto_suggester.sf") as mock_sf,
             caplog.at_level(logging.DEBUG, logger="src.backend.ml.oto_suggester"),
         ):
-            mock_librosa.get_duration.return_value = 0.4
+            mock_sf.info.return_value.duration = 0.4
             await suggester.suggest_oto(Path("/fake/_ka.wav"), alias="- ka")
 
         # Both SOFA and MMS_FA warnings should be present
@@ -182,6 +182,15 @@ class TestExtractTranscriptWithMetadata:
         assert result.original_filename == "path/to/か子音.wav"
         assert result.transcript == "ka"
 
+    def test_repeated_filename_is_cached(self) -> None:
+        """Test repeated lookups of the same filename share one result."""
+        first = extract_transcript_with_metadata("_a_ka.wav")
+        second = extract_transcript_with_metadata("_a_ka.wav")
+
+        assert first is second
+        with pytest.raises(AttributeError):
+            first.transcript = "changed"  # type: ignore[misc]
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""